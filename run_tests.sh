@@ -14,8 +14,15 @@ if [ -f ".venv/bin/activate" ]; then
 fi
 
 # Run tests
+# pytest-xdist spreads tests across all CPUs (addopts in pyproject.toml),
+# equivalent to: python3 -m pytest -n auto --dist loadgroup tests/
+# conftest.py points TASK_MONITOR_CONFIG at a per-test file, so tests never
+# share the real default config and can run on any worker.
+# Pass "-n 0" to run serially when debugging.
+# Scripted runs skip the .pytest_cache write; interactive runs keep it for
+# --lf/--ff/--sw.
 echo "Running model and config tests..."
-python3 -m pytest tests/test_models.py tests/test_config.py tests/test_file_utils.py -v
+python3 -m pytest -p no:cacheprovider tests/test_models.py tests/test_config.py tests/test_file_utils.py -v
 
 echo ""
 echo "==================================="
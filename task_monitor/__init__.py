@@ -21,10 +21,28 @@ from task_monitor.models import (
 )
 
 from task_monitor.config import ConfigManager, DEFAULT_CONFIG_FILE
-from task_monitor.scanner import TaskScanner
-from task_monitor.executor import SyncTaskExecutor, create_executor
-from task_monitor.task_runner import TaskRunner
-from task_monitor.watchdog import WatchdogManager, TaskDocumentWatcher
+
+# Components pulling in the Claude SDK or watchdog load on first access
+# (PEP 562), so importing task_monitor.config stays cheap.
+_LAZY_IMPORTS = {
+    "TaskScanner": "task_monitor.scanner",
+    "SyncTaskExecutor": "task_monitor.executor",
+    "create_executor": "task_monitor.executor",
+    "TaskRunner": "task_monitor.task_runner",
+    "WatchdogManager": "task_monitor.watchdog",
+    "TaskDocumentWatcher": "task_monitor.watchdog",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     # Models
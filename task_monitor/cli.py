@@ -12,11 +12,14 @@ import os
 import argparse
 import subprocess
 import threading
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
-from task_monitor.config import ConfigManager, DEFAULT_CONFIG_FILE
+from task_monitor.config import ConfigManager, get_default_config_file
 from task_monitor.task_runner import TaskRunner
 from task_monitor.executor import get_lock_file_path, LockInfo, get_locked_task
+from task_monitor.file_utils import move_file
 
 
 def _restart_daemon() -> bool:
@@ -97,41 +100,51 @@ def cmd_init(args):
 
     print("\n📋 Registering Task Source Directories...")
 
-    if not config_manager.config.project_workspace:
-        config_manager.set_project_workspace(str(project_workspace))
-        print(f"   ✅ Set Project Workspace: {project_workspace}")
-
-    for queue in queues:
-        source_id = queue["id"]
-        task_monitor = str(queue["path"])
-
-        if args.skip_existing and config_manager.config.get_queue(source_id):
-            print(f"   ⏭️  Skipped existing: {source_id}")
-            continue
-
-        try:
-            if args.force and config_manager.config.get_queue(source_id):
-                config_manager.config.remove_queue(source_id)
-                print(f"   🔄 Removed existing: {source_id}")
-
-            config_manager.add_queue(
-                path=task_monitor,
-                id=source_id,
-                description=queue["description"]
-            )
-            print(f"   ✅ Registered: {source_id}")
-            print(f"      Path: {task_monitor}")
-        except Exception as e:
-            print(f"   ❌ Failed to register {source_id}: {e}")
-            return 1
-
+    # One config write for the workspace and all queue registrations. A
+    # failed registration breaks out so the batch still saves the earlier
+    # ones; every save happens inside the try.
+    registration_failed = False
     try:
-        config_manager.save_config()
-        print("\n💾 Configuration saved")
+        with config_manager.batch_updates():
+            if not config_manager.config.project_workspace:
+                config_manager.set_project_workspace(str(project_workspace))
+                print(f"   ✅ Set Project Workspace: {project_workspace}")
+
+            for queue in queues:
+                source_id = queue["id"]
+                task_monitor = str(queue["path"])
+
+                if args.skip_existing and config_manager.config.get_queue(source_id):
+                    print(f"   ⏭️  Skipped existing: {source_id}")
+                    continue
+
+                try:
+                    if args.force and config_manager.config.get_queue(source_id):
+                        config_manager.config.remove_queue(source_id)
+                        print(f"   🔄 Removed existing: {source_id}")
+
+                    config_manager.add_queue(
+                        path=task_monitor,
+                        id=source_id,
+                        description=queue["description"]
+                    )
+                    print(f"   ✅ Registered: {source_id}")
+                    print(f"      Path: {task_monitor}")
+                except Exception as e:
+                    print(f"   ❌ Failed to register {source_id}: {e}")
+                    registration_failed = True
+                    break
+
+            if not registration_failed:
+                config_manager.save_config()
     except Exception as e:
         print(f"\n❌ Failed to save configuration: {e}")
         return 1
 
+    if registration_failed:
+        return 1
+    print("\n💾 Configuration saved")
+
     config_manager = ConfigManager(args.config)
     registered = config_manager.config.queues
 
@@ -307,21 +320,22 @@ def cmd_queues_list(args):
     return 0
 
 
-def cmd_queues_add(args):
+def cmd_queues_add(args, config_manager: Optional[ConfigManager] = None):
     """Add a Queue."""
     try:
-        config_manager = ConfigManager(args.config)
-
-        if not config_manager.config.project_workspace:
-            config_manager.set_project_workspace(args.project_workspace)
-
-        queue = config_manager.add_queue(
-            path=args.queue_path,
-            id=args.id,  # Fixed: was args.queue_id, but argument is --id
-            description=args.description or ""
-        )
-
-        config_manager.save_config()
+        if config_manager is None:
+            config_manager = ConfigManager(args.config)
+
+        # Saved once when the block exits
+        with config_manager.batch_updates():
+            if not config_manager.config.project_workspace:
+                config_manager.set_project_workspace(args.project_workspace)
+
+            queue = config_manager.add_queue(
+                path=args.queue_path,
+                id=args.id,  # Fixed: was args.queue_id, but argument is --id
+                description=args.description or ""
+            )
 
         print(f"\n✅ Added Queue '{args.id}'")  # Fixed: was args.queue_id
         print(f"   Path: {args.queue_path}")
@@ -345,10 +359,11 @@ def cmd_queues_add(args):
     return 0
 
 
-def cmd_queues_rm(args):
+def cmd_queues_rm(args, config_manager: Optional[ConfigManager] = None):
     """Remove a Queue."""
     try:
-        config_manager = ConfigManager(args.config)
+        if config_manager is None:
+            config_manager = ConfigManager(args.config)
         config = config_manager.config
 
         queue = config.get_queue(args.queue_id)
@@ -376,16 +391,19 @@ def cmd_queues_rm(args):
 
 def _find_task_file(task_id: str, config) -> Path:
     """Find a task file by ID in any source directory."""
+    filename = f"{task_id}.md"
     for queue in config.queues:
         queue_path = Path(queue.path)
-        # Check in task-documents (pending/)
-        task_file = queue_path / f"{task_id}.md"
-        if task_file.exists():
-            return task_file
-        # Check in completed/failed (subdirectories within the queue)
-        for subdir in ["completed", "failed"]:
-            task_file = queue_path / subdir / f"{task_id}.md"
-            if task_file.exists():
+        candidates = [
+            # Task documents (pending/, or directly in the queue)
+            queue_path / "pending" / filename,
+            queue_path / filename,
+            # completed/failed as subdirectories within the queue
+            queue_path / "completed" / filename,
+            queue_path / "failed" / filename,
+        ]
+        for task_file in candidates:
+            if task_file.is_file():
                 return task_file
     return None
 
@@ -511,8 +529,7 @@ def cmd_tasks_cancel(args):
             failed_dir = task_file.parent.parent / "failed"
 
             failed_dir.mkdir(parents=True, exist_ok=True)
-            import shutil
-            shutil.move(str(task_file), str(failed_dir / task_file.name))
+            move_file(task_file, failed_dir / task_file.name)
 
             print(f"✅ Task moved to failed directory")
             print(f"   Reason: User cancelled")
@@ -744,8 +761,9 @@ def cmd_run(args):
 # MAIN
 # =============================================================================
 
-def main():
-    """CLI entry point."""
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser; cached since it never changes at runtime."""
     parser = argparse.ArgumentParser(
         description="Task Monitor CLI (Directory-Based State)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -852,10 +870,16 @@ Examples:
     run_parser.add_argument("--cycles", type=int, default=0, help="Number of cycles")
     run_parser.set_defaults(func=cmd_run)
 
+    return parser
+
+
+def main():
+    """CLI entry point."""
+    parser = _build_parser()
     args = parser.parse_args()
 
     if not args.config:
-        args.config = DEFAULT_CONFIG_FILE
+        args.config = get_default_config_file()
 
     if hasattr(args, 'func'):
         return args.func(args)
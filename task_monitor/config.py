@@ -4,14 +4,56 @@ Configuration management for task-monitor.
 Handles loading, saving, and updating monitor configuration.
 """
 
+import os
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 
-from task_monitor.models import MonitorConfig, Queue
+from task_monitor.models import MonitorConfig, MonitorSettings, Queue
 from task_monitor.file_utils import AtomicFileWriter, FileLock
 from task_monitor.constants import DEFAULT_CONFIG_DIR, DEFAULT_CONFIG_FILE
 
 
+# File identity used to key the parse cache: (inode, mtime_ns, ctime_ns, size)
+_StatSig = Tuple[int, int, int, int]
+
+# Config data that passed validation, keyed by absolute path ->
+# (stat signature, data). A matching signature skips the read and JSON
+# parse; rebuilding from known-good data through pydantic-core is cheaper
+# than deep-copying a cached model or model_construct().
+_PARSE_CACHE: Dict[str, Tuple[_StatSig, Dict[str, Any]]] = {}
+
+# Names accepted by ConfigManager.update_settings
+_SETTING_NAMES = frozenset(MonitorSettings.model_fields)
+
+# Legacy field name -> current field name. Applied regardless of "version":
+# releases that already wrote "2.0" still used task_source_directories.
+_FIELD_RENAMES = (
+    ("project_path", "project_workspace"),
+    ("task_doc_directories", "queues"),
+    ("task_source_directories", "queues"),
+)
+
+
+def _stat_sig(st: os.stat_result) -> _StatSig:
+    """
+    Signature identifying one version of a file.
+
+    The inode changes on every atomic replace, so a same-size rewrite within
+    one coarse mtime tick still misses the cache.
+    """
+    return (st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+
+
+def _migrate_config_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Rename legacy config fields in place and return the data."""
+    for old, new in _FIELD_RENAMES:
+        if old in data:
+            data[new] = data.pop(old)
+    return data
+
+
 class ConfigManager:
     """
     Manages task monitor configuration.
@@ -25,49 +67,122 @@ class ConfigManager:
         Initialize configuration manager.
 
         Args:
-            config_file: Path to configuration file. Defaults to ~/.config/task-monitor/config.json
+            config_file: Path to configuration file. Defaults to $TASK_MONITOR_CONFIG,
+                then ~/.config/task-monitor/config.json
         """
-        self.config_file = Path(config_file) if config_file else DEFAULT_CONFIG_FILE
+        self.config_file = Path(config_file) if config_file else get_default_config_file()
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Lock file for config access
-        self.lock = FileLock(self.config_file.with_suffix('.lock'))
+        # Unsaved mutator changes; saves are deferred inside batch_updates()
+        self._dirty = False
+        self._batch_depth = 0
 
         # Load or create default config
         self.config = self._load_config()
 
+    @cached_property
+    def lock(self) -> FileLock:
+        """
+        Lock file for config access.
+
+        Created on first use: most managers only read the config. Each
+        manager keeps its own FileLock because the lock holds its open fd.
+        """
+        return FileLock(self.config_file.with_suffix('.lock'))
+
     def _load_config(self) -> MonitorConfig:
-        """Load configuration from file or create default."""
+        """
+        Load configuration from file or create default.
+
+        Rebuilds from previously validated data, skipping the read and parse,
+        when the file's stat signature is unchanged.
+        """
+        cache_key = os.path.abspath(self.config_file)
+        try:
+            st = os.stat(self.config_file)
+        except OSError:
+            st = None
+        sig = _stat_sig(st) if st is not None else None
+
+        if sig is not None:
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None and cached[0] == sig:
+                return MonitorConfig.model_validate(cached[1])
+
         data = AtomicFileWriter.read_json(self.config_file)
 
         if data is None:
             return self._create_default_config()
 
         try:
-            # Handle migration from old config format
-            if "task_source_directories" in data:
-                data["queues"] = data.pop("task_source_directories")
-            return MonitorConfig(**data)
+            config = MonitorConfig(**_migrate_config_data(data))
         except Exception as e:
             print(f"Warning: Invalid config file, using defaults: {e}")
             return self._create_default_config()
 
+        if sig is not None:
+            _PARSE_CACHE[cache_key] = (sig, data)
+        return config
+
     def _create_default_config(self) -> MonitorConfig:
         """Create default configuration."""
         return MonitorConfig()
 
     def save_config(self) -> None:
         """Save configuration atomically with locking."""
+        # Cleared up front so a failed save is not retried by batch_updates()
+        self._dirty = False
         if not self.lock.acquire(timeout=5):
             raise RuntimeError("Could not acquire config lock")
 
         try:
-            AtomicFileWriter.write_json(self.config_file, self.config.model_dump(), indent=2)
+            data = self.config.model_dump()
+            st = AtomicFileWriter.write_json(self.config_file, data, indent=2)
+            # Seed the parse cache so the next load of this file skips the
+            # read. The rename updates ctime, so stat the target again and
+            # seed only if it is still our inode.
+            current = os.stat(self.config_file)
+            if current.st_ino == st.st_ino:
+                _PARSE_CACHE[os.path.abspath(self.config_file)] = (_stat_sig(current), data)
         finally:
             self.lock.release()
 
+    def _changed(self) -> None:
+        """Record a mutation and save it unless inside batch_updates()."""
+        self._dirty = True
+        if not self._batch_depth:
+            self.save_config()
+
+    @contextmanager
+    def batch_updates(self) -> Iterator["ConfigManager"]:
+        """
+        Coalesce saves from mutators into a single write.
+
+        Mutators called inside the block only mark the config dirty; it is
+        saved once when the outermost block exits normally. If the block
+        raises, nothing is written and the pending changes are discarded by
+        reloading from disk, so a later save cannot persist them.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._batch_depth == 1 and self._dirty:
+                self.reload()
+            raise
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth and self._dirty:
+            self.save_config()
+
     def reload(self) -> None:
-        """Reload configuration from disk."""
+        """
+        Reload configuration from disk, discarding unsaved in-memory changes.
+
+        Always rebuilds self.config; only the read and parse are skipped
+        when the file is unchanged.
+        """
+        self._dirty = False
         self.config = self._load_config()
 
     # Project workspace management
@@ -83,7 +198,7 @@ class ConfigManager:
             ValueError: If path doesn't exist or is not a directory
         """
         self.config.set_project_workspace(path)
-        self.save_config()
+        self._changed()
 
     def get_project_workspace(self) -> Optional[str]:
         """Get the current project workspace path."""
@@ -116,7 +231,7 @@ class ConfigManager:
             id=id,
             description=description
         )
-        self.save_config()
+        self._changed()
         return queue
 
     def remove_queue(self, queue_id: str) -> bool:
@@ -132,7 +247,7 @@ class ConfigManager:
         result = self.config.remove_queue(queue_id)
 
         if result:
-            self.save_config()
+            self._changed()
 
         return result
 
@@ -157,14 +272,19 @@ class ConfigManager:
 
         Args:
             **kwargs: Settings to update (watch_enabled, watch_debounce_ms, etc.)
+
+        Raises:
+            ValueError: If any key is not a setting (nothing is applied)
         """
+        if not kwargs.keys() <= _SETTING_NAMES:
+            unknown = next(key for key in kwargs if key not in _SETTING_NAMES)
+            raise ValueError(f"Unknown setting: {unknown}")
+
+        settings = self.config.settings
         for key, value in kwargs.items():
-            if hasattr(self.config.settings, key):
-                setattr(self.config.settings, key, value)
-            else:
-                raise ValueError(f"Unknown setting: {key}")
+            setattr(settings, key, value)
 
-        self.save_config()
+        self._changed()
 
     # Lock management for external access
 
@@ -177,6 +297,19 @@ class ConfigManager:
         self.lock.release()
 
 
+def get_default_config_file() -> Path:
+    """
+    Get the default configuration file path.
+
+    Read at call time so TASK_MONITOR_CONFIG set after import still applies.
+
+    Returns:
+        $TASK_MONITOR_CONFIG if set, else DEFAULT_CONFIG_FILE
+    """
+    override = os.environ.get("TASK_MONITOR_CONFIG")
+    return Path(override) if override else DEFAULT_CONFIG_FILE
+
+
 def get_default_config_manager() -> ConfigManager:
     """Get the default configuration manager."""
-    return ConfigManager(DEFAULT_CONFIG_FILE)
+    return ConfigManager(get_default_config_file())
@@ -18,18 +18,21 @@ import threading
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, TYPE_CHECKING
 
 from task_monitor.task_runner import TaskRunner
-from task_monitor.config import ConfigManager, DEFAULT_CONFIG_FILE
-from task_monitor.watchdog import WatchdogManager
+from task_monitor.config import ConfigManager, get_default_config_file
 from task_monitor.models import Queue
 
+if TYPE_CHECKING:
+    from task_monitor.watchdog import WatchdogManager
+
 
 # Worker timeouts
 WORKER_KEEPALIVE_TIMEOUT = 60  # seconds
 WORKER_RETRY_DELAY = 10  # seconds
 WORKER_CYCLE_PAUSE = 0.1  # seconds
+WORKER_SHUTDOWN_TIMEOUT = 5.0  # seconds, shared by all workers
 
 
 # Configure logging
@@ -70,14 +73,14 @@ class TaskQueueDaemon:
         Args:
             config_file: Path to configuration file
         """
-        self.config_file = config_file or DEFAULT_CONFIG_FILE
+        self.config_file = config_file or get_default_config_file()
 
         self.task_runner: TaskRunner = None
         self.running = False
         self.shutdown_requested = False
 
         # Watchdog manager
-        self.watchdog_manager: WatchdogManager = None
+        self.watchdog_manager: "WatchdogManager" = None
 
         # Worker threads (one per Task Source Directory)
         self._worker_threads: Dict[str, threading.Thread] = {}
@@ -115,6 +118,9 @@ class TaskQueueDaemon:
     def _setup_watchdog(self) -> None:
         """Setup watchdog for all configured Task Source Directories."""
         if self.watchdog_manager is None:
+            # Imported here so the watchdog/inotify stack loads only when watching
+            from task_monitor.watchdog import WatchdogManager
+
             self.watchdog_manager = WatchdogManager(self._on_watchdog_event)
 
         config_manager = ConfigManager(self.config_file)
@@ -173,10 +179,15 @@ class TaskQueueDaemon:
         """
         logger.debug(f"Watchdog event: {Path(task_doc_file).name} in '{source_id}'")
 
-        # Signal the specific worker for this source
+        # Signal the specific worker for this source. One file edit fires
+        # several events; skip Event.set()'s lock + notify if already signaled.
+        if self.task_runner is not None:
+            self.task_runner.invalidate_queue(source_id)
+
         with self._events_lock:
-            if source_id in self._source_events:
-                self._source_events[source_id].set()
+            source_event = self._source_events.get(source_id)
+        if source_event is not None and not source_event.is_set():
+            source_event.set()
 
     def start(self) -> None:
         """Start the daemon."""
@@ -214,6 +225,8 @@ class TaskQueueDaemon:
         if self.watchdog_manager:
             watched = self.watchdog_manager.get_watched_queues()
             logger.info(f"Monitoring {len(watched)} source(s)")
+            # Watched queues get invalidation events, so their listings can be cached
+            self.task_runner.watched_queues = set(watched)
 
         # Start processing loop
         self.running = True
@@ -325,9 +338,12 @@ class TaskQueueDaemon:
 
         # Wait for all workers to stop
         logger.info("Waiting for worker threads to stop...")
+        # One deadline for all workers, so N stuck workers cost at most
+        # WORKER_SHUTDOWN_TIMEOUT in total rather than N times it
+        deadline = time.monotonic() + WORKER_SHUTDOWN_TIMEOUT
         for source_id, worker in list(self._worker_threads.items()):
             if worker.is_alive():
-                worker.join(timeout=5.0)
+                worker.join(timeout=max(0.0, deadline - time.monotonic()))
                 if worker.is_alive():
                     logger.warning(f"Worker '{source_id}' did not stop gracefully")
 
@@ -9,18 +9,22 @@ containing thread_id, worker, pid, and started_at timestamp.
 """
 
 import asyncio
-import json
+import errno
 import logging
+import operator
 import os
 import threading
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Any, Dict
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 
 from dotenv import load_dotenv
 from claude_agent_sdk import query, ClaudeAgentOptions
 
+from task_monitor.file_utils import _dumps, _loads
+
 
 logging.basicConfig(
     level=logging.INFO,
@@ -48,7 +52,7 @@ _ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
 _ANTHROPIC_BASE_URL = os.getenv("ANTHROPIC_BASE_URL", "")
 
 
-@dataclass
+@dataclass(slots=True)
 class LockInfo:
     """Lock file information for running task tracking."""
     task_id: str
@@ -59,39 +63,73 @@ class LockInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            "task_id": self.task_id,
+            "worker": self.worker,
+            "thread_id": self.thread_id,
+            "pid": self.pid,
+            "started_at": self.started_at,
+        }
 
     @classmethod
     def from_file(cls, lock_file: Path) -> Optional['LockInfo']:
         """Read lock info from file."""
         try:
-            with open(lock_file, 'r') as f:
-                data = json.load(f)
-            return cls(**data)
+            with open(lock_file, 'rb') as f:
+                raw = f.read()
+        except Exception:
+            return None
+        return cls.from_bytes(raw)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> Optional['LockInfo']:
+        """Parse lock info from the raw contents of a lock file."""
+        # Lock files are JSON objects; reject anything else without parsing
+        if raw.lstrip()[:1] != b"{" or b'"pid"' not in raw:
+            return None
+        try:
+            # One C-level lookup of all required keys (KeyError if any missing)
+            return cls(*_lock_fields_of(_loads(raw)))
         except Exception:
             return None
 
     def save(self, lock_file: Path) -> None:
         """Save lock info to file."""
-        with open(lock_file, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        # Encode straight to bytes (orjson when available), one write
+        payload = _dumps(self.to_dict(), indent=2)
+        with open(lock_file, 'wb') as f:
+            f.write(payload)
+
+
+# Positional LockInfo constructor arguments, in field order
+_lock_fields_of = operator.itemgetter(*(f.name for f in fields(LockInfo)))
 
 
 def get_lock_file_path(task_file: Path) -> Path:
     """Get the lock file path for a task file."""
     # Lock file is in the same directory as the task file
     # Name: .task-{id}.lock
-    return task_file.parent / f".{task_file.stem}.lock"
+    # String ops instead of deriving .parent/.stem PurePaths
+    task_dir, name = os.path.split(os.fspath(task_file))
+    stem = name[:-3] if name.endswith(".md") else os.path.splitext(name)[0]
+    return Path(task_dir, f".{stem}.lock")
 
 
 def is_task_locked(task_file: Path) -> bool:
     """Check if a task is currently locked (running)."""
     lock_file = get_lock_file_path(task_file)
-    if not lock_file.exists():
+    # Open directly rather than stat first: most tasks are unlocked
+    try:
+        with open(lock_file, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
         return False
+    except OSError:
+        # Present but unreadable - treat as held
+        return True
 
     # Check if lock is stale (process no longer running)
-    lock_info = LockInfo.from_file(lock_file)
+    lock_info = LockInfo.from_bytes(raw)
     if lock_info and not process_exists(lock_info.pid):
         # Stale lock - remove it
         try:
@@ -100,34 +138,62 @@ def is_task_locked(task_file: Path) -> bool:
             pass
         return False
 
-    return lock_file.exists()
+    return True
 
 
 def get_locked_task(task_source_dir: Path) -> Optional[str]:
     """Get the currently locked task ID in a directory."""
-    lock_files = list(task_source_dir.glob(".task-*.lock"))
-    if not lock_files:
+    # Single scandir pass matching .task-*.lock by name; stops at the first
+    # live lock instead of listing and globbing the whole directory
+    try:
+        entries = os.scandir(task_source_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return None
 
-    # Return the first locked task (should be only one per directory)
-    for lock_file in lock_files:
-        lock_info = LockInfo.from_file(lock_file)
-        if lock_info and process_exists(lock_info.pid):
-            return lock_info.task_id
+    with entries:
+        # Return the first locked task (should be only one per directory)
+        for entry in entries:
+            if not (entry.name.startswith(".task-") and entry.name.endswith(".lock")):
+                continue
+            lock_info = LockInfo.from_file(entry.path)
+            if lock_info and process_exists(lock_info.pid):
+                return lock_info.task_id
 
     # If all locks are stale, return None
     return None
 
 
+# pidfd_open (Linux 5.3+) only accepts thread-group leaders, so a lock PID
+# recycled as another process's thread ID does not read as live
+_pidfd_open = getattr(os, "pidfd_open", None)
+
+
 def process_exists(pid: int) -> bool:
     """Check if a process with given PID exists."""
+    if _pidfd_open is not None:
+        try:
+            os.close(_pidfd_open(pid))
+            return True
+        except ProcessLookupError:
+            return False
+        except OSError as e:
+            # EINVAL/ENOENT: bad pid, or a thread ID that is not a process
+            # (the errno varies by kernel). Anything else (no pidfd_open,
+            # seccomp, fd or memory exhaustion) says nothing about the
+            # process, so use /proc below
+            if e.errno in (errno.EINVAL, errno.ENOENT):
+                return False
+        except (TypeError, OverflowError):
+            # Non-int or out-of-range pid from a hand-edited lock file
+            pass
+
     try:
         return os.path.exists(f"/proc/{pid}")
     except Exception:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of task execution with SDK metadata."""
     success: bool
@@ -146,9 +212,14 @@ class ExecutionResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary for JSON serialization."""
-        data = asdict(self)
-        # Remove None values
-        return {k: v for k, v in data.items() if v is not None}
+        # Shallow read of the fixed field list; skips asdict's recursive copy
+        data = {}
+        for name in _RESULT_FIELDS:
+            value = getattr(self, name)
+            # Remove None values
+            if value is not None:
+                data[name] = value
+        return data
 
     def save_to_file(self, project_workspace: Path, worker: str = "ad-hoc") -> Path:
         """
@@ -162,15 +233,30 @@ class ExecutionResult:
             Path to saved result file
         """
         result_dir = project_workspace / "tasks" / worker / "results"
-        result_dir.mkdir(parents=True, exist_ok=True)
-
         result_file = result_dir / f"{self.task_id}.json"
-        with open(result_file, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        payload = _dumps(self.to_dict(), indent=2)
+
+        # The results directory normally exists; only mkdir when open misses it
+        try:
+            f = open(result_file, 'wb')
+        except FileNotFoundError:
+            result_dir.mkdir(parents=True, exist_ok=True)
+            f = open(result_file, 'wb')
+        with f:
+            f.write(payload)
 
         return result_file
 
 
+_RESULT_FIELDS = tuple(f.name for f in fields(ExecutionResult))
+
+
+@lru_cache(maxsize=32)
+def _resolve_workspace(workspace: str) -> Path:
+    """Resolve an absolute workspace path; cached since workspaces are stable."""
+    return Path(workspace).resolve()
+
+
 class SyncTaskExecutor:
     """
     Synchronous task executor using Claude Agent SDK.
@@ -185,7 +271,9 @@ class SyncTaskExecutor:
         Args:
             project_workspace: Path to project workspace directory (can be overridden in execute())
         """
-        self.project_workspace = Path(project_workspace).resolve() if project_workspace else None
+        self.project_workspace = (
+            _resolve_workspace(os.path.abspath(project_workspace)) if project_workspace else None
+        )
 
     def execute(
         self,
@@ -204,8 +292,10 @@ class SyncTaskExecutor:
         Returns:
             ExecutionResult with execution outcome
         """
-        if project_workspace:
-            self.project_workspace = Path(project_workspace).resolve()
+        # TaskRunner passes its already-resolved workspace on every call;
+        # only resolve (readlink/stat per component) when it changes
+        if project_workspace and project_workspace != self.project_workspace:
+            self.project_workspace = _resolve_workspace(os.path.abspath(project_workspace))
 
         if not self.project_workspace:
             raise ValueError("project_workspace must be set")
@@ -225,12 +315,16 @@ class SyncTaskExecutor:
         thread_id = str(current_thread.ident or 0)
         process_pid = os.getpid()
 
+        # Format the start time once for both the lock and the result
+        start_time = datetime.now()
+        started_at_str = start_time.isoformat()
+
         lock_info = LockInfo(
             task_id=task_id,
             worker=worker,
             thread_id=thread_id,
             pid=process_pid,
-            started_at=datetime.now().isoformat()
+            started_at=started_at_str
         )
 
         lock_file = get_lock_file_path(task_file)
@@ -239,9 +333,6 @@ class SyncTaskExecutor:
 
         logger.info(f"[{task_id}] Task started: {relative_task_path}")
 
-        start_time = datetime.now()
-        started_at_str = start_time.isoformat()
-
         result = ExecutionResult(
             success=False,
             task_id=task_id,
@@ -6,13 +6,50 @@ for concurrent task monitoring.
 """
 
 import os
+import errno
+import re
 import fcntl
+import shutil
 import tempfile
 import atexit
+import threading
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 import json
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps(data: Any, indent: Optional[int]) -> bytes:
+    """Serialize data to JSON bytes, using orjson when available."""
+    # orjson supports exactly two layouts: 2-space indent and compact
+    if orjson is not None and indent in (2, None):
+        # Passthrough routes datetimes/dataclasses through default=str,
+        # so values match what the stdlib encoder writes.
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+    # Same bytes as orjson for its two layouts: raw UTF-8, no spaces when compact
+    separators = (",", ":") if indent is None else (",", ": ")
+    return json.dumps(
+        data, indent=indent, default=str, ensure_ascii=False, separators=separators
+    ).encode()
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class AtomicFileWriter:
     """
@@ -24,14 +61,36 @@ class AtomicFileWriter:
     """
 
     @staticmethod
-    def write_json(filepath: Path, data: Any, indent: int = 2) -> None:
+    def write_json(filepath: Path, data: Any, indent: Optional[int] = 2) -> os.stat_result:
         """
         Atomically write JSON data to a file.
 
         Args:
             filepath: Target file path
             data: Data to serialize as JSON
-            indent: JSON indentation level
+            indent: JSON indentation level (None for compact output)
+
+        Returns:
+            Stat of the written file (taken before the replace, so it
+            describes this write even if another writer follows)
+
+        Raises:
+            Exception: If write fails (temp file is cleaned up)
+        """
+        return AtomicFileWriter.write_bytes(filepath, _dumps(data, indent))
+
+    @staticmethod
+    def write_bytes(filepath: Path, payload: bytes) -> os.stat_result:
+        """
+        Atomically write raw bytes to a file.
+
+        Args:
+            filepath: Target file path
+            payload: Bytes to write
+
+        Returns:
+            Stat of the written file (taken before the replace, so it
+            describes this write even if another writer follows)
 
         Raises:
             Exception: If write fails (temp file is cleaned up)
@@ -41,21 +100,26 @@ class AtomicFileWriter:
 
         temp_path = None
         try:
-            # Create temporary file in same directory for atomic replace
-            with tempfile.NamedTemporaryFile(
-                mode='w',
+            # Create temporary file in same directory for atomic replace;
+            # write through the raw fd, with no file object or buffer copy
+            fd, temp_name = tempfile.mkstemp(
                 dir=filepath.parent,
                 prefix=f".{filepath.name}.",
-                suffix='.tmp',
-                delete=False
-            ) as tmp_file:
-                temp_path = Path(tmp_file.name)
-                json.dump(data, tmp_file, indent=indent, default=str)
-                tmp_file.flush()
-                os.fsync(tmp_file.fileno())  # Force write to disk
+                suffix='.tmp'
+            )
+            temp_path = Path(temp_name)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)  # Force write to disk
+                st = os.fstat(fd)
+            finally:
+                os.close(fd)
 
             # Atomic replace (POSIX guarantees this is atomic)
             os.replace(temp_path, filepath)
+            return st
 
         except Exception as e:
             # Clean up temp file on error
@@ -84,8 +148,9 @@ class AtomicFileWriter:
             return default
 
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
+            with open(filepath, 'rb') as f:
+                return _loads(f.read())
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         except (json.JSONDecodeError, IOError):
             return default
 
@@ -107,6 +172,14 @@ class FileLock:
                 lock.release()
     """
 
+    # Seconds between flock attempts while another process holds the lock
+    POLL_INTERVAL = 0.1
+
+    # In-process locks shared by every FileLock on the same path, so threads
+    # of one process queue on a threading.Lock instead of polling flock
+    _proc_locks: Dict[str, threading.Lock] = {}
+    _proc_locks_guard = threading.Lock()
+
     def __init__(self, lockfile: Path):
         """
         Initialize file lock.
@@ -117,6 +190,16 @@ class FileLock:
         self.lockfile = Path(lockfile)
         self.lockfile.parent.mkdir(parents=True, exist_ok=True)
         self.fd: Optional[Any] = None
+        self._held_proc_lock: Optional[threading.Lock] = None
+
+    def _proc_lock(self) -> threading.Lock:
+        """Return the in-process lock for this lock file's path."""
+        key = os.path.abspath(self.lockfile)
+        with FileLock._proc_locks_guard:
+            lock = FileLock._proc_locks.get(key)
+            if lock is None:
+                lock = FileLock._proc_locks[key] = threading.Lock()
+            return lock
 
     def acquire(self, timeout: float = 10.0) -> bool:
         """
@@ -132,7 +215,15 @@ class FileLock:
 
         start_time = time.time()
 
-        while time.time() - start_time < timeout:
+        # Wait out holders in this process without touching the lock file
+        proc_lock = self._proc_lock()
+        if not proc_lock.acquire(timeout=max(timeout, 0)):
+            return False
+        self._held_proc_lock = proc_lock
+
+        # Attempt at least once after winning the in-process lock, then poll
+        # other processes' holds until the deadline
+        while True:
             try:
                 # Open lock file
                 self.fd = open(self.lockfile, 'w')
@@ -154,16 +245,28 @@ class FileLock:
                 if self.fd:
                     self.fd.close()
                     self.fd = None
-                time.sleep(0.1)
+                remaining = timeout - (time.time() - start_time)
+                if remaining <= 0:
+                    break
+                # Never sleep past the deadline
+                time.sleep(min(self.POLL_INTERVAL, remaining))
 
             except Exception as e:
                 if self.fd:
                     self.fd.close()
                     self.fd = None
+                self._release_proc_lock()
                 raise e
 
+        self._release_proc_lock()
         return False
 
+    def _release_proc_lock(self) -> None:
+        """Release the in-process lock if this instance holds it."""
+        proc_lock, self._held_proc_lock = self._held_proc_lock, None
+        if proc_lock is not None:
+            proc_lock.release()
+
     def release(self) -> None:
         """Release the lock."""
         if self.fd:
@@ -182,6 +285,9 @@ class FileLock:
             except Exception:
                 pass
 
+        # Hand over to the next waiter in this process only after cleanup
+        self._release_proc_lock()
+
     def __enter__(self):
         """Context manager entry."""
         if not self.acquire():
@@ -210,39 +316,42 @@ class FileLock:
             return True
 
 
-def is_valid_task_id(task_id: str) -> bool:
+def move_file(src: Path, dst: Path) -> None:
     """
-    Validate task ID format.
+    Move a file to dst, replacing any existing file there.
 
-    Expected format: task-YYYYMMDD-HHMMSS-description
+    Uses a single os.replace() (one rename syscall) and only falls back to
+    shutil.move's copy + unlink when src and dst are on different filesystems.
 
     Args:
-        task_id: Task ID to validate
+        src: File to move
+        dst: Destination file path (not a directory)
 
-    Returns:
-        True if valid format
+    Raises:
+        OSError: If the move fails
     """
-    if not task_id.startswith("task-"):
-        return False
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
 
-    # Remove "task-" prefix
-    rest = task_id[5:]
 
-    # Check for timestamp pattern (YYYYMMDD-HHMMSS)
-    parts = rest.split("-", 2)
+# "task-" + 8-digit date + "-" + 6-digit time, then end or "-description"
+_TASK_ID_RE = re.compile(r"task-\d{8}-\d{6}(?:-|\Z)", re.ASCII)
 
-    if len(parts) < 2:
-        return False
 
-    date_part = parts[0]
-    time_part = parts[1]
+def is_valid_task_id(task_id: str) -> bool:
+    """
+    Validate task ID format.
 
-    # Validate date (8 digits)
-    if len(date_part) != 8 or not date_part.isdigit():
-        return False
+    Expected format: task-YYYYMMDD-HHMMSS-description
 
-    # Validate time (6 digits)
-    if len(time_part) != 6 or not time_part.isdigit():
-        return False
+    Args:
+        task_id: Task ID to validate
 
-    return True
+    Returns:
+        True if valid format
+    """
+    return _TASK_ID_RE.match(task_id) is not None
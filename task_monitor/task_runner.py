@@ -10,16 +10,34 @@ No state file - directory structure is the source of truth:
 - tasks/planned/failed/       - failed planned tasks
 """
 
+import fnmatch
 import os
-import shutil
+import re
 import socket
+import threading
 import uuid
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Iterator, Optional, List, Dict, Set
 from datetime import datetime
 
 from task_monitor.models import Queue
 from task_monitor.executor import SyncTaskExecutor
+from task_monitor.file_utils import move_file
+
+
+# Task document filenames, matched on DirEntry.name without a stat per entry
+_TASK_FILE_RE = re.compile(fnmatch.translate("task-*.md"))
+
+
+def _iter_task_files(directory: Path) -> Iterator[os.DirEntry]:
+    """Yield entries for task-*.md regular files in directory (none if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if _TASK_FILE_RE.match(entry.name) and entry.is_file():
+                    yield entry
+    except (FileNotFoundError, NotADirectoryError):
+        return
 
 
 class TaskRunner:
@@ -27,6 +45,13 @@ class TaskRunner:
     Simplified task runner using directory-based state.
 
     No state file - the directory structure tells us everything.
+
+    Pick order: queues in watched_queues are served from a cached listing,
+    so a task added to pending/ is only seen once the watchdog event for it
+    calls invalidate_queue() (after the debounce delay) or the listing
+    drains. Until then, a new task that sorts before the cached ones waits
+    its turn. Unwatched queues (watch_enabled off) are rescanned on every
+    pick and always run in strict filename order.
     """
 
     def __init__(
@@ -44,6 +69,32 @@ class TaskRunner:
         # Executor for running tasks
         self.executor = SyncTaskExecutor()
 
+        # Queues whose pending/ directory the watchdog reports changes for.
+        # Only their listings are cached: nothing else invalidates them.
+        self.watched_queues: Set[str] = set()
+
+        # Per-queue snapshot of pending tasks, newest first so the next task
+        # is at the end. Dropped by invalidate_queue() on watchdog events;
+        # the generation counter keeps a scan that raced an invalidation
+        # from being stored.
+        self._pending_cache: Dict[str, List[Path]] = {}
+        self._cache_generations: Dict[str, int] = {}
+        self._cache_lock = threading.Lock()
+
+    def invalidate_queue(self, queue_id: str) -> None:
+        """
+        Drop the cached pending listing for a queue.
+
+        Called when the queue's pending/ directory changes so the next pick
+        rescans it.
+
+        Args:
+            queue_id: Queue ID whose listing is stale
+        """
+        with self._cache_lock:
+            self._cache_generations[queue_id] = self._cache_generations.get(queue_id, 0) + 1
+            self._pending_cache.pop(queue_id, None)
+
     def _get_queue_dirs(self, queue: Queue) -> tuple[Path, Path]:
         """
         Get archive and failed directories for a specific queue.
@@ -70,8 +121,8 @@ class TaskRunner:
         """
         Pick the next task to execute from all queues.
 
-        Scans directories, sorts by filename (chronological order),
-        and returns the first available task.
+        Scans directories and returns the task with the smallest
+        filename (chronological order).
 
         Args:
             queues: List of queues to scan
@@ -79,27 +130,16 @@ class TaskRunner:
         Returns:
             Path to task document, or None if no pending tasks
         """
-        all_tasks = []
+        best = None
 
-        # Scan all queue pending directories
+        # Single pass over all pending directories keeping the smallest
+        # filename (chronological: task-YYYYMMDD-HHMMSS-*); no full sort
         for queue in queues:
-            pending_path = Path(queue.path) / "pending"
-            if not pending_path.exists():
-                continue
-
-            # Find all task-*.md files
-            for task_file in pending_path.glob("task-*.md"):
-                if task_file.is_file():
-                    all_tasks.append(task_file)
-
-        # Sort by filename (chronological: task-YYYYMMDD-HHMMSS-*)
-        all_tasks.sort(key=lambda p: p.name)
-
-        # Return first available task
-        if all_tasks:
-            return all_tasks[0]
+            for entry in _iter_task_files(Path(queue.path) / "pending"):
+                if best is None or entry.name < best.name:
+                    best = entry
 
-        return None
+        return Path(best.path) if best is not None else None
 
     def pick_next_task_from_queue(
         self,
@@ -109,7 +149,9 @@ class TaskRunner:
         Pick the next task to execute from a SINGLE queue.
 
         For parallel execution: each worker thread calls this for its own queue.
-        Tasks are picked in chronological order (by filename).
+        Tasks are picked in chronological order (by filename). For queues in
+        watched_queues the listing is cached until it drains or
+        invalidate_queue() is called; other queues are rescanned every call.
 
         Args:
             queue: Queue configuration
@@ -117,22 +159,37 @@ class TaskRunner:
         Returns:
             Path to task document, or None if no pending tasks in this queue
         """
-        pending_path = Path(queue.path) / "pending"
-        if not pending_path.exists():
-            return None
+        use_cache = queue.id in self.watched_queues
 
-        # Find all task-*.md files
-        all_tasks = []
-        for task_file in pending_path.glob("task-*.md"):
-            if task_file.is_file():
-                all_tasks.append(task_file)
+        # Serve from the cached listing while its head is still pending;
+        # executed tasks have been moved out, so they fall off here.
+        cached = self._pending_cache.get(queue.id) if use_cache else None
+        while cached:
+            if cached[-1].is_file():
+                return cached[-1]
+            cached.pop()
+
+        with self._cache_lock:
+            generation = self._cache_generations.get(queue.id, 0)
 
-        # Sort by filename (chronological: task-YYYYMMDD-HHMMSS-*)
-        all_tasks.sort(key=lambda p: p.name)
+        # Find all task-*.md files
+        all_tasks = [
+            Path(entry.path)
+            for entry in _iter_task_files(Path(queue.path) / "pending")
+        ]
+
+        # Sort by filename, newest first (chronological: task-YYYYMMDD-HHMMSS-*)
+        all_tasks.sort(key=lambda p: p.name, reverse=True)
+        if use_cache:
+            with self._cache_lock:
+                # An invalidation during the scan means it may have missed a
+                # task; leave the cache empty so the next pick rescans
+                if self._cache_generations.get(queue.id, 0) == generation:
+                    self._pending_cache[queue.id] = all_tasks
 
         # Return first available task
         if all_tasks:
-            return all_tasks[0]
+            return all_tasks[-1]
 
         return None
 
@@ -166,7 +223,7 @@ class TaskRunner:
             if result.success:
                 # Move to completed
                 try:
-                    shutil.move(str(task_file), str(archive_dir / task_file.name))
+                    move_file(task_file, archive_dir / task_file.name)
                 except OSError as e:
                     return {
                         "status": "warning",
@@ -177,7 +234,7 @@ class TaskRunner:
                 # Move to failed directory
                 try:
                     failed_file = failed_dir / task_file.name
-                    shutil.move(str(task_file), str(failed_file))
+                    move_file(task_file, failed_file)
 
                     # Add error info to task document
                     error_file = failed_file.with_suffix(f".error.{uuid.uuid4().hex[:8]}")
@@ -201,7 +258,7 @@ class TaskRunner:
             try:
                 # Move to failed directory
                 failed_file = failed_dir / task_file.name
-                shutil.move(str(task_file), str(failed_file))
+                move_file(task_file, failed_file)
             except OSError:
                 pass
 
@@ -243,9 +300,7 @@ class TaskRunner:
             }
 
             # Count pending tasks
-            for task_file in pending_path.glob("task-*.md"):
-                if task_file.is_file():
-                    queue_stats["pending"] += 1
+            queue_stats["pending"] = sum(1 for _ in _iter_task_files(pending_path))
 
             # Get per-queue directories for this queue
             archive_dir, failed_dir = self._get_queue_dirs(queue)
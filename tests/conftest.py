@@ -1,23 +1,160 @@
 """Test fixtures for task-monitor tests (Directory-Based State Architecture)."""
 
+import hashlib
+import itertools
+import json
+import os
 import pytest
-import tempfile
 import shutil
-from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
 from unittest.mock import Mock
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
 from task_monitor.models import (
     MonitorConfig, Queue, MonitorSettings, DiscoveredTask
 )
+from task_monitor.cli import _build_parser
+from task_monitor.config import _PARSE_CACHE
+
+
+# Read-only template for configs written by make_config.
+_BASE_CFG = MappingProxyType({
+    "version": "2.0",
+    "settings": {},
+    "project_workspace": None,
+    "queues": [],
+})
+
+def _dump_json(data) -> bytes:
+    """Serialize test data with sorted keys, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True).encode()
+
+
+@pytest.fixture(autouse=True)
+def _no_subprocess_coverage(request, monkeypatch):
+    """Keep coverage from instrumenting child interpreters of no_cover tests."""
+    if request.node.get_closest_marker("no_cover"):
+        monkeypatch.delenv("COVERAGE_PROCESS_START", raising=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_cli_parser():
+    """Build the cached CLI argument parser once per worker, before any test."""
+    _build_parser()
+
+
+@pytest.fixture(scope="session")
+def _default_config_dir(tmp_path_factory):
+    """Directory holding each test's private default config file."""
+    return tmp_path_factory.mktemp("default-config")
+
+
+_default_config_ids = itertools.count()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_default_config(_default_config_dir, monkeypatch):
+    """Point TASK_MONITOR_CONFIG at a per-test file so no test touches ~/.config."""
+    config_file = _default_config_dir / f"config-{next(_default_config_ids)}.json"
+    monkeypatch.setenv("TASK_MONITOR_CONFIG", str(config_file))
+    return config_file
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_caches():
+    """Start each test without configs parsed by earlier tests."""
+    _PARSE_CACHE.clear()
+
+
+@pytest.fixture
+def temp_dir(tmp_path):
+    """Create a temporary directory for test files (unique per xdist worker)."""
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def base_workspace(tmp_path_factory):
+    """Build the standard queue directory layout once per session."""
+    base = tmp_path_factory.mktemp("base-workspace")
+    for queue_dir in ("ad-hoc/pending", "ad-hoc/completed", "ad-hoc/results", "planned/pending"):
+        (base / "tasks" / queue_dir).mkdir(parents=True)
+    return base
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path)
+def workspace(base_workspace, tmp_path_factory):
+    """Create a fresh copy of the standard workspace layout for one test."""
+    workspace_path = tmp_path_factory.mktemp("ws")
+    shutil.copytree(base_workspace, workspace_path, dirs_exist_ok=True)
+    return workspace_path
+
+
+@pytest.fixture(scope="session")
+def config_factory(tmp_path_factory):
+    """
+    Factory writing each distinct config to a content-addressed file once per session.
+
+    The returned path is shared by every test asking for the same config, so
+    it is read-only: tests that save or edit a config must copy it into
+    tmp_path first.
+    """
+    def _make(config):
+        payload = _dump_json(config)
+        key = hashlib.blake2b(payload, digest_size=8).hexdigest()
+        config_path = tmp_path_factory.getbasetemp() / f"cfg_{key}.json"
+        if not config_path.exists():
+            config_path.write_bytes(payload)
+        return str(config_path)
+    return _make
+
+
+@pytest.fixture
+def make_config(config_factory):
+    """
+    Factory for the standard config shape with the given workspace and queues.
+
+    Returns a shared config_factory path; tests must not modify the file.
+    """
+    def _make(workspace, queues=(), version="2.0"):
+        return config_factory({
+            **_BASE_CFG,
+            "version": version,
+            "project_workspace": str(workspace) if workspace is not None else None,
+            "queues": [{"id": queue_id, "path": str(path)} for queue_id, path in queues],
+        })
+    return _make
+
+
+@pytest.fixture(scope="session")
+def _task_template(tmp_path_factory):
+    """Minimal task document shared by make_task_file."""
+    template = tmp_path_factory.mktemp("templates") / "task.md"
+    template.write_text("# Task")
+    return template
+
+
+@pytest.fixture
+def make_task_file(_task_template):
+    """
+    Factory placing a minimal task document at dest.
+
+    Hardlinks the session template instead of writing the file. Tests may
+    move or unlink the result but must not modify it in place.
+    """
+    def _make(dest):
+        try:
+            os.link(_task_template, dest)
+        except OSError:
+            shutil.copyfile(_task_template, dest)
+        return dest
+    return _make
 
 
 @pytest.fixture
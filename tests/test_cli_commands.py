@@ -10,22 +10,47 @@ Tests the CLI functionality including:
 - Daemon stays running
 """
 
+import os
+import sys
 import pytest
 import subprocess
-import tempfile
 import json
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+import threading
 import time
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import Mock, MagicMock
+
+from task_monitor.config import ConfigManager
+from task_monitor.cli import (
+    cmd_queues_add,
+    cmd_queues_rm,
+    cmd_status,
+    cmd_queues_list,
+    _restart_daemon,
+)
+
+
+@dataclass
+class CLIArgs:
+    """Parsed CLI arguments as seen by the cmd_* functions."""
+    config: str = None
+    queue_path: str = None
+    project_workspace: str = None
+    id: str = None
+    description: str = None
+    queue_id: str = None
+    detailed: bool = False
 
 
 class TestCLICommands:
     """Test CLI command functionality."""
 
     @pytest.fixture
-    def temp_config(self):
+    def temp_config(self, tmp_path):
         """Create a temporary config file for testing."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+        config_path = tmp_path / "config.json"
+        with open(config_path, 'w') as f:
             config = {
                 "version": "2.0",
                 "settings": {
@@ -40,51 +65,51 @@ class TestCLICommands:
                 "queues": []
             }
             json.dump(config, f, indent=2)
-            f.flush()
-            config_path = f.name
-        yield config_path
-        # Cleanup
-        Path(config_path).unlink(missing_ok=True)
+        return str(config_path)
 
     @pytest.fixture
-    def temp_workspace(self):
+    def temp_workspace(self, tmp_path):
         """Create a temporary workspace directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-            # Create task directories
-            (workspace / "tasks").mkdir()
-            (workspace / "tasks" / "ad-hoc" / "pending").mkdir(parents=True)
-            (workspace / "tasks" / "ad-hoc" / "completed").mkdir(parents=True)
-            (workspace / "tasks" / "ad-hoc" / "failed").mkdir(parents=True)
-            yield workspace
-
-    @pytest.fixture
-    def mock_systemctl(self):
-        """Mock systemctl commands to avoid actual service manipulation."""
-        with patch('subprocess.run') as mock_run:
-            # Mock successful systemctl calls
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="Active: active (running)\n",
-                stderr=""
+        workspace = tmp_path / "workspace"
+        # Create task directories (parents are created implicitly)
+        for leaf in ("pending", "completed", "failed"):
+            (workspace / "tasks" / "ad-hoc" / leaf).mkdir(parents=True, exist_ok=True)
+        return workspace
+
+    @pytest.fixture(autouse=True)
+    def _stub_daemon_restart(self, monkeypatch):
+        """Stub daemon restart to avoid actual service manipulation."""
+        monkeypatch.setattr('task_monitor.cli._restart_daemon', lambda: True)
+
+    @pytest.mark.parametrize(
+        "mode",
+        ["in_process", pytest.param("subprocess", marks=pytest.mark.no_cover)]
+    )
+    def test_register_paths(self, mode, temp_workspace, tmp_path, capsys):
+        """Test that queues add creates the config and registers the queue."""
+        # Configuration is auto-created on first use
+        config_file = tmp_path / "test-config.json"
+        queue_path = temp_workspace / "tasks" / "ad-hoc"
+
+        if mode == "in_process":
+            args = CLIArgs(
+                config=str(config_file),
+                queue_path=str(queue_path),
+                project_workspace=str(temp_workspace),
+                id="test-source"
+            )
+            assert cmd_queues_add(args) == 0
+            assert "Added" in capsys.readouterr().out
+        else:
+            # Run against this checkout whether or not the package is installed
+            repo_root = Path(__file__).resolve().parent.parent
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join(
+                filter(None, [str(repo_root), env.get("PYTHONPATH")])
             )
-            yield mock_run
-
-    def test_register_creates_config(self, temp_workspace):
-        """Test that register command creates config if it doesn't exist."""
-        # This test verifies the behavior mentioned in documentation:
-        # "Configuration is auto-created on first use"
-
-        # Use a temporary config location
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_dir = Path(tmpdir)
-            config_file = config_dir / "test-config.json"
-            queue_path = temp_workspace / "tasks" / "ad-hoc"
-
-            # Run sources add command
             result = subprocess.run(
                 [
-                    "python3", "-m", "task_monitor.cli",
+                    sys.executable, "-B", "-m", "task_monitor.cli",
                     "--config", str(config_file),
                     "queues", "add", str(queue_path),
                     "--id", "test-source",
@@ -92,143 +117,58 @@ class TestCLICommands:
                 ],
                 capture_output=True,
                 text=True,
-                cwd="/home/admin/workspaces/task-monitor"
+                cwd=repo_root,
+                env=env
             )
+            assert "Added" in result.stdout
 
-            # Verify config was created
-            assert config_file.exists(), "Config file should be created"
-
-            # Verify config content
-            with open(config_file) as f:
-                config = json.load(f)
-
-            assert config["project_workspace"] == str(temp_workspace)
-            assert len(config["queues"]) == 1
-            assert config["queues"][0]["id"] == "test-source"
-
-    def test_register_adds_source(self, temp_config, temp_workspace, mock_systemctl):
-        """Test that register adds a source directory to config."""
-        from task_monitor.config import ConfigManager
-        from task_monitor.cli import cmd_queues_add
-        from argparse import Namespace
-
-        # Create args - queues add uses 'id' not 'queue_id'
-        args = Namespace(
-            config=temp_config,
-            queue_path=str(temp_workspace / "tasks" / "ad-hoc"),
-            project_workspace=str(temp_workspace),
-            id="test-source",
-            description=None  # Optional description
-        )
+        # Verify config was created
+        assert config_file.exists(), "Config file should be created"
 
-        # Run register command
-        result = cmd_queues_add(args)
-
-        assert result == 0
-
-        # Verify source was added - reload config from file
-        config_manager = ConfigManager(Path(temp_config))
-        config = config_manager.config
+        config = ConfigManager(config_file).config
+        assert config.project_workspace == str(temp_workspace)
         assert len(config.queues) == 1
         assert config.queues[0].id == "test-source"
-        assert config.queues[0].path == str(temp_workspace / "tasks" / "ad-hoc")
+        assert config.queues[0].path == str(queue_path)
 
-    def test_unregister_removes_source(self, temp_config, temp_workspace, mock_systemctl):
+    def test_unregister_removes_source(self, temp_config, temp_workspace):
         """Test that sources rm removes a source directory from config."""
-        from task_monitor.config import ConfigManager
-        from task_monitor.cli import cmd_queues_add, cmd_queues_rm
-        from argparse import Namespace
-
         # First register a queue - queues add uses 'id' not 'queue_id'
-        args_reg = Namespace(
+        args_reg = CLIArgs(
             config=temp_config,
             queue_path=str(temp_workspace / "tasks" / "ad-hoc"),
             project_workspace=str(temp_workspace),
-            id="test-source",
-            description=None  # Optional description
+            id="test-source"
         )
-        result = cmd_queues_add(args_reg)
+        config_manager = ConfigManager(Path(temp_config))
+        result = cmd_queues_add(args_reg, config_manager=config_manager)
         assert result == 0
 
-        # Verify source was added - reload from file
-        config_manager = ConfigManager(Path(temp_config))
+        # Verify source was added
         assert len(config_manager.config.queues) == 1
 
         # Now unregister it
-        args_unreg = Namespace(
-            config=temp_config,
-            queue_id="test-source"
-        )
-        result = cmd_queues_rm(args_unreg)
+        args_unreg = CLIArgs(config=temp_config, queue_id="test-source")
+        result = cmd_queues_rm(args_unreg, config_manager=config_manager)
 
         assert result == 0
 
-        # Verify source was removed - reload from file
-        config_manager = ConfigManager(Path(temp_config))
+        # Verify source was removed
         assert len(config_manager.config.queues) == 0
+        # ...and that the removal was saved
+        assert ConfigManager(Path(temp_config)).config.queues == []
 
     def test_unregister_nonexistent_source(self, temp_config):
         """Test that queues rm handles non-existent queues gracefully."""
-        from task_monitor.config import ConfigManager
-        from task_monitor.cli import cmd_queues_rm
-        from argparse import Namespace
-
-        args = Namespace(
-            config=temp_config,
-            queue_id="nonexistent"
-        )
+        args = CLIArgs(config=temp_config, queue_id="nonexistent")
 
         result = cmd_queues_rm(args)
 
         # Should return error code
         assert result == 1
 
-    def test_restart_daemon_called(self, temp_config, temp_workspace):
-        """Test that register and unregister call systemctl restart."""
-        from task_monitor.cli import _restart_daemon
-
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="",
-                stderr=""
-            )
-
-            # Test restart daemon function
-            result = _restart_daemon()
-
-            assert result == True
-            mock_run.assert_called_once()
-
-            # Verify systemctl command
-            call_args = mock_run.call_args
-            assert call_args[0][0] == ["systemctl", "--user", "restart", "task-queue.service"]
-
-    def test_restart_daemon_handles_failure(self, temp_config, temp_workspace):
-        """Test that restart daemon handles systemctl failures."""
-        from task_monitor.cli import _restart_daemon
-
-        with patch('subprocess.run') as mock_run:
-            # Mock systemctl failure
-            mock_run.side_effect = subprocess.CalledProcessError(
-                returncode=1,
-                cmd=["systemctl", "--user", "restart", "task-queue.service"],
-                stderr="Failed to restart"
-            )
-
-            # Should return False but not raise exception
-            result = _restart_daemon()
-
-            assert result == False
-
-    def test_status_command(self, temp_config, temp_workspace):
+    def test_status_command(self, temp_config, temp_workspace, capsys):
         """Test status command output."""
-        from task_monitor.config import ConfigManager
-        from task_monitor.cli import cmd_status
-        from argparse import Namespace
-        from io import StringIO
-        import sys
-
         config_manager = ConfigManager(Path(temp_config))
         config_manager.set_project_workspace(str(temp_workspace))
         config_manager.add_queue(
@@ -236,30 +176,17 @@ class TestCLICommands:
             id="test-source"
         )
 
-        args = Namespace(config=temp_config, detailed=False)
+        args = CLIArgs(config=temp_config)
 
-        # Capture stdout
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-
-        try:
-            result = cmd_status(args)
-            output = sys.stdout.getvalue()
-        finally:
-            sys.stdout = old_stdout
+        result = cmd_status(args)
+        output = capsys.readouterr().out
 
         assert result == 0
         assert "Task Monitor Status" in output
         assert "test-source" in output
 
-    def test_list_sources_command(self, temp_config, temp_workspace):
+    def test_list_sources_command(self, temp_config, temp_workspace, capsys):
         """Test sources list command."""
-        from task_monitor.config import ConfigManager
-        from task_monitor.cli import cmd_queues_list
-        from argparse import Namespace
-        from io import StringIO
-        import sys
-
         config_manager = ConfigManager(Path(temp_config))
         config_manager.set_project_workspace(str(temp_workspace))
         config_manager.add_queue(
@@ -267,135 +194,75 @@ class TestCLICommands:
             id="test-source"
         )
 
-        args = Namespace(config=temp_config, detailed=False)
+        args = CLIArgs(config=temp_config)
 
-        # Capture stdout
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-
-        try:
-            result = cmd_queues_list(args)
-            output = sys.stdout.getvalue()
-        finally:
-            sys.stdout = old_stdout
+        result = cmd_queues_list(args)
+        output = capsys.readouterr().out
 
         assert result == 0
         assert "Task Source Directories" in output
         assert "test-source" in output
 
 
-class TestDaemonFix:
-    """Test the daemon worker thread fix."""
+class TestRestartDaemon:
+    """Test daemon restart via systemctl."""
+
+    def test_restart_daemon_called(self, monkeypatch):
+        """Test that register and unregister call systemctl restart."""
+        mock_run = Mock(return_value=MagicMock(returncode=0, stdout="", stderr=""))
+        monkeypatch.setattr('subprocess.run', mock_run)
 
-    def test_worker_threads_not_daemon(self):
-        """Test that worker threads are created with daemon=False."""
-        import threading
+        # Test restart daemon function
+        result = _restart_daemon()
 
-        # Create a thread with daemon=False
-        thread = threading.Thread(
-            target=lambda: None,
-            daemon=False
-        )
+        assert result == True
+        mock_run.assert_called_once()
+
+        # Verify systemctl command
+        call_args = mock_run.call_args
+        assert call_args[0][0] == ["systemctl", "--user", "restart", "task-queue.service"]
+
+    def test_restart_daemon_handles_failure(self, monkeypatch):
+        """Test that restart daemon handles systemctl failures."""
+        # Mock systemctl failure
+        mock_run = Mock(side_effect=subprocess.CalledProcessError(
+            returncode=1,
+            cmd=["systemctl", "--user", "restart", "task-queue.service"],
+            stderr="Failed to restart"
+        ))
+        monkeypatch.setattr('subprocess.run', mock_run)
+
+        # Should return False but not raise exception
+        result = _restart_daemon()
 
-        # Verify thread is NOT a daemon thread
-        assert thread.daemon == False, "Worker threads should NOT be daemon threads"
+        assert result == False
+
+
+class TestDaemonFix:
+    """Test the daemon worker thread fix."""
 
     def test_daemon_stays_running_with_non_daemon_threads(self):
         """Test that daemon stays running when worker threads are non-daemon."""
-        import threading
-        import time
-
         worker_ran = [False]
 
         def worker_loop():
             """Simulated worker that runs continuously."""
             for i in range(3):
                 worker_ran[0] = True
-                time.sleep(0.1)
+                time.sleep(0)
 
         # Create thread with daemon=False
         worker = threading.Thread(target=worker_loop, daemon=False)
+        assert worker.daemon is False, "Worker threads should NOT be daemon threads"
         worker.start()
 
         # Thread should complete
-        worker.join(timeout=2)
+        worker.join(timeout=1)
 
         assert worker_ran[0], "Worker should have executed"
         assert not worker.is_alive(), "Worker should be complete"
 
 
-class TestCLIIntegration:
-    """Integration tests for complete CLI workflows."""
-
-    def test_register_unregister_workflow(self):
-        """Test complete register -> list -> unregister workflow."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_dir = Path(tmpdir)
-            config_file = config_dir / "test-config.json"
-
-            with tempfile.TemporaryDirectory() as workspace_dir:
-                workspace = Path(workspace_dir)
-                # Create task directories
-                (workspace / "tasks").mkdir()
-                (workspace / "tasks" / "ad-hoc" / "pending").mkdir(parents=True)
-                task_source_dir = workspace / "tasks" / "ad-hoc" / "pending"
-
-                # Mock systemctl to avoid actual service restart
-                original_run = subprocess.run
-                def mock_run(cmd, *args, **kwargs):
-                    # If it's a systemctl command, mock it
-                    if cmd and len(cmd) > 0 and "systemctl" in str(cmd[0]):
-                        return MagicMock(returncode=0, stdout="", stderr="")
-                    # Otherwise run normally
-                    return original_run(cmd, *args, **kwargs)
-
-                with patch('subprocess.run', side_effect=mock_run):
-                    # 1. Register (queues add)
-                    result = subprocess.run(
-                        [
-                            "python3", "-m", "task_monitor.cli",
-                            "--config", str(config_file),
-                            "queues", "add", str(workspace / "tasks" / "ad-hoc"),
-                            "--id", "test",
-                            "--project-workspace", str(workspace)
-                        ],
-                        capture_output=True,
-                        text=True,
-                        cwd="/home/admin/workspaces/task-monitor"
-                    )
-
-                    assert "Added" in result.stdout
-
-                    # 2. List queues
-                    result = subprocess.run(
-                        [
-                            "python3", "-m", "task_monitor.cli",
-                            "--config", str(config_file),
-                            "queues", "list"
-                        ],
-                        capture_output=True,
-                        text=True,
-                        cwd="/home/admin/workspaces/task-monitor"
-                    )
-
-                    assert "test" in result.stdout
-
-                    # 3. Remove (queues rm)
-                    result = subprocess.run(
-                        [
-                            "python3", "-m", "task_monitor.cli",
-                            "--config", str(config_file),
-                            "queues", "rm",
-                            "--queue-id", "test"
-                        ],
-                        capture_output=True,
-                        text=True,
-                        cwd="/home/admin/workspaces/task-monitor"
-                    )
-
-                    assert "Removed" in result.stdout
-
-
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v", "-s"])
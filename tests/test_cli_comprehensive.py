@@ -12,14 +12,10 @@ Tests for commands that are currently not well covered:
 """
 
 import pytest
-import tempfile
-import subprocess
 import json
-import shutil
-from pathlib import Path
-from unittest.mock import patch, MagicMock, call
-from io import StringIO
-import sys
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 from task_monitor.cli import (
     cmd_init,
@@ -31,22 +27,31 @@ from task_monitor.cli import (
     cmd_logs,
     _find_task_file,
 )
+from task_monitor.executor import LockInfo, get_lock_file_path
+from task_monitor.models import Queue, MonitorConfig
+
+
+# Known-valid lock for the cancel tests; vary fields with dataclasses.replace.
+_LOCK_TEMPLATE = LockInfo(
+    task_id="task-123",
+    worker="ad-hoc",
+    thread_id="12345",
+    pid=0,
+    started_at="2026-02-07T12:00:00"
+)
 
 
 class TestFindTaskFile:
     """Tests for _find_task_file helper function."""
 
-    def test_find_task_file_in_pending(self, temp_dir):
+    def test_find_task_file_in_pending(self, workspace, make_task_file):
         """Test finding task file in pending directory."""
-        workspace = temp_dir / "workspace"
         queue_path = workspace / "tasks" / "ad-hoc"
-        queue_path.mkdir(parents=True)
 
-        task_file = queue_path / "task-123.md"
-        task_file.write_text("# Task")
+        task_file = queue_path / "pending" / "task-123.md"
+        make_task_file(task_file)
 
         # Create mock config
-        from task_monitor.models import Queue, MonitorConfig
         config = MonitorConfig(
             project_workspace=str(workspace),
             queues=[Queue(id="ad-hoc", path=str(queue_path))]
@@ -55,20 +60,14 @@ class TestFindTaskFile:
         result = _find_task_file("task-123", config)
         assert result == task_file
 
-    def test_find_task_file_in_completed(self, temp_dir):
+    def test_find_task_file_in_completed(self, workspace, make_task_file):
         """Test finding task file in completed directory."""
-        workspace = temp_dir / "workspace"
-        # Queue path is the pending directory
-        queue_path = workspace / "tasks" / "ad-hoc" / "pending"
-        queue_path.mkdir(parents=True)
-        completed_path = workspace / "tasks" / "ad-hoc" / "completed"
-        completed_path.mkdir(parents=True)
-
-        task_file = completed_path / "task-123.md"
-        task_file.write_text("# Task")
-
-        # Create mock config - queue path points to pending
-        from task_monitor.models import Queue, MonitorConfig
+        queue_path = workspace / "tasks" / "ad-hoc"
+
+        task_file = queue_path / "completed" / "task-123.md"
+        make_task_file(task_file)
+
+        # Create mock config
         config = MonitorConfig(
             project_workspace=str(workspace),
             queues=[Queue(id="ad-hoc", path=str(queue_path))]
@@ -77,13 +76,10 @@ class TestFindTaskFile:
         result = _find_task_file("task-123", config)
         assert result == task_file
 
-    def test_find_task_file_not_found(self, temp_dir):
+    def test_find_task_file_not_found(self, workspace):
         """Test finding non-existent task file."""
-        workspace = temp_dir / "workspace"
         queue_path = workspace / "tasks" / "ad-hoc"
-        queue_path.mkdir(parents=True)
 
-        from task_monitor.models import Queue, MonitorConfig
         config = MonitorConfig(
             project_workspace=str(workspace),
             queues=[Queue(id="ad-hoc", path=str(queue_path))]
@@ -96,190 +92,116 @@ class TestFindTaskFile:
 class TestCmdInit:
     """Tests for cmd_init command."""
 
-    def test_cmd_init_basic(self, temp_dir):
-        """Test basic initialization."""
+    @pytest.mark.parametrize(
+        "force,skip_existing",
+        [(False, False), (True, False), (False, True)],
+        ids=["basic", "force", "skip_existing"],
+    )
+    def test_cmd_init(self, temp_dir, monkeypatch, capsys, force, skip_existing):
+        """Test initialization with the --force and --skip-existing flags."""
         config_file = temp_dir / "config.json"
 
-        args = MagicMock(
+        args = SimpleNamespace(
             config=config_file,
-            force=False,
-            skip_existing=False,
+            force=force,
+            skip_existing=skip_existing,
             restart_daemon=False
         )
 
-        # Change to temp dir for init
-        original_cwd = Path.cwd()
-        import os
-        os.chdir(temp_dir)
-
-        try:
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
+        monkeypatch.chdir(temp_dir)
 
-            try:
-                result = cmd_init(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
-
-            assert result == 0
-            assert "Initialization complete" in output
-
-            # Check directories were created
-            assert (temp_dir / "tasks" / "ad-hoc" / "pending").exists()
-            assert (temp_dir / "tasks" / "ad-hoc" / "completed").exists()
-            assert (temp_dir / "tasks" / "planned" / "pending").exists()
-
-            # Check config was created
-            assert config_file.exists()
-        finally:
-            os.chdir(original_cwd)
-
-    def test_cmd_init_force(self, temp_dir):
-        """Test init with --force flag."""
-        config_file = temp_dir / "config.json"
+        if skip_existing:
+            # First init, so the second one has existing queues to skip
+            cmd_init(args)
+            capsys.readouterr()
 
-        args = MagicMock(
-            config=config_file,
-            force=True,
-            skip_existing=False,
-            restart_daemon=False
-        )
+        result = cmd_init(args)
+        output = capsys.readouterr().out
 
-        original_cwd = Path.cwd()
-        import os
-        os.chdir(temp_dir)
+        assert result == 0
+        assert "Initialization complete" in output
 
-        try:
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
+        # Check directories were created
+        assert (temp_dir / "tasks" / "ad-hoc" / "pending").exists()
+        assert (temp_dir / "tasks" / "ad-hoc" / "completed").exists()
+        assert (temp_dir / "tasks" / "planned" / "pending").exists()
 
-            try:
-                result = cmd_init(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
+        # Check config was created
+        assert config_file.exists()
 
-            assert result == 0
-            assert "Initialization complete" in output
-        finally:
-            os.chdir(original_cwd)
+    @pytest.mark.parametrize("save_fails", [False, True], ids=["saved", "save_fails"])
+    def test_cmd_init_registration_failure(self, temp_dir, monkeypatch, capsys, save_fails):
+        """Test a failed registration returns 1, keeping earlier ones and catching save errors."""
+        from task_monitor.config import ConfigManager
 
-    def test_cmd_init_skip_existing(self, temp_dir):
-        """Test init with --skip-existing flag."""
         config_file = temp_dir / "config.json"
+        args = SimpleNamespace(config=config_file, force=False, skip_existing=False, restart_daemon=False)
+        monkeypatch.chdir(temp_dir)
 
-        args = MagicMock(
-            config=config_file,
-            force=False,
-            skip_existing=True,
-            restart_daemon=False
-        )
+        original_add_queue = ConfigManager.add_queue
 
-        original_cwd = Path.cwd()
-        import os
-        os.chdir(temp_dir)
+        def add_queue(self, path, id=None, **kwargs):
+            if id == "planned":
+                raise ValueError("boom")
+            return original_add_queue(self, path, id=id, **kwargs)
 
-        try:
-            # First init
-            cmd_init(args)
+        def failing_save(self):
+            raise RuntimeError("Could not acquire config lock")
 
-            # Second init with skip_existing
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
+        monkeypatch.setattr(ConfigManager, "add_queue", add_queue)
+        if save_fails:
+            monkeypatch.setattr(ConfigManager, "save_config", failing_save)
 
-            try:
-                result = cmd_init(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
+        assert cmd_init(args) == 1
 
-            assert result == 0
-        finally:
-            os.chdir(original_cwd)
+        output = capsys.readouterr().out
+        assert "Failed to register planned: boom" in output
+        if save_fails:
+            assert "Failed to save configuration" in output
+            assert not config_file.exists()
+        else:
+            assert [q["id"] for q in json.loads(config_file.read_text())["queues"]] == ["ad-hoc"]
 
 
 class TestCmdTasksShow:
     """Tests for cmd_tasks_show command."""
 
-    def test_cmd_tasks_show_found(self, temp_dir):
+    def test_cmd_tasks_show_found(self, workspace, make_task_file, make_config, capsys):
         """Test showing found task."""
-        workspace = temp_dir / "workspace"
         queue_path = workspace / "tasks" / "ad-hoc"
-        queue_path.mkdir(parents=True)
         task_file = queue_path / "task-123.md"
-        task_file.write_text("# Task")
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": str(workspace),
-                "queues": [{"id": "ad-hoc", "path": str(queue_path)}]
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        try:
-            args = MagicMock(config=config_path, task_id="task-123")
-
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                result = cmd_tasks_show(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
-
-            assert result == 0
-            assert "task-123.md" in output
-            assert "cat" in output or "less" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
-
-    def test_cmd_tasks_show_not_found(self, temp_dir):
-        """Test showing non-existent task."""
-        workspace = temp_dir / "workspace"
+        make_task_file(task_file)
+
+        config_path = make_config(workspace, queues=[("ad-hoc", queue_path)])
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": str(workspace),
-                "queues": []
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
+        args = SimpleNamespace(config=config_path, task_id="task-123")
 
-        try:
-            args = MagicMock(config=config_path, task_id="nonexistent")
+        result = cmd_tasks_show(args)
+        output = capsys.readouterr().out
 
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
+        assert result == 0
+        assert "task-123.md" in output
+        assert "cat" in output or "less" in output
+
+    def test_cmd_tasks_show_not_found(self, workspace, make_config, capsys):
+        """Test showing non-existent task."""
+        config_path = make_config(workspace)
 
-            try:
-                result = cmd_tasks_show(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
+        args = SimpleNamespace(config=config_path, task_id="nonexistent")
 
-            assert result == 1
-            assert "not found" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
+        result = cmd_tasks_show(args)
+        output = capsys.readouterr().out
+
+        assert result == 1
+        assert "not found" in output
 
 
 class TestCmdTasksLogs:
     """Tests for cmd_tasks_logs command."""
 
-    def test_cmd_tasks_logs_found(self, temp_dir):
+    def test_cmd_tasks_logs_found(self, workspace, make_config, capsys):
         """Test showing logs for task with result file."""
-        workspace = temp_dir / "workspace"
         results_dir = workspace / "tasks" / "ad-hoc" / "results"
-        results_dir.mkdir(parents=True)
 
         result_file = results_dir / "task-123.json"
         result_data = {
@@ -291,412 +213,188 @@ class TestCmdTasksLogs:
         }
         result_file.write_text(json.dumps(result_data))
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": str(workspace),
-                "queues": []
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        try:
-            args = MagicMock(config=config_path, task_id="task-123")
-
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                result = cmd_tasks_logs(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
-
-            assert result == 0
-            assert "Success" in output or "✅" in output
-            assert "duration" in output.lower()
-        finally:
-            Path(config_path).unlink(missing_ok=True)
-
-    def test_cmd_tasks_logs_not_found(self, temp_dir):
-        """Test showing logs for task with no result file."""
-        workspace = temp_dir / "workspace"
+        config_path = make_config(workspace)
+
+        args = SimpleNamespace(config=config_path, task_id="task-123")
+
+        result = cmd_tasks_logs(args)
+        output = capsys.readouterr().out
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": str(workspace),
-                "queues": []
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
+        assert result == 0
+        assert "Success" in output or "✅" in output
+        assert "duration" in output.lower()
 
-        try:
-            args = MagicMock(config=config_path, task_id="task-123")
+    def test_cmd_tasks_logs_not_found(self, workspace, make_config, capsys):
+        """Test showing logs for task with no result file."""
+        config_path = make_config(workspace)
 
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
+        args = SimpleNamespace(config=config_path, task_id="task-123")
 
-            try:
-                result = cmd_tasks_logs(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
+        result = cmd_tasks_logs(args)
+        output = capsys.readouterr().out
 
-            assert result == 1
-            assert "No result logs found" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
+        assert result == 1
+        assert "No result logs found" in output
 
 
 class TestCmdTasksCancel:
     """Tests for cmd_tasks_cancel command."""
 
-    def test_cmd_tasks_cancel_not_found(self, temp_dir):
+    def test_cmd_tasks_cancel_not_found(self, workspace, make_config, capsys):
         """Test cancelling non-existent task."""
-        workspace = temp_dir / "workspace"
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": str(workspace),
-                "queues": []
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        try:
-            args = MagicMock(config=config_path, task_id="nonexistent")
-
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                result = cmd_tasks_cancel(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
-
-            assert result == 1
-            assert "not found" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
-
-    def test_cmd_tasks_cancel_not_running(self, temp_dir):
+        config_path = make_config(workspace)
+
+        args = SimpleNamespace(config=config_path, task_id="nonexistent")
+
+        result = cmd_tasks_cancel(args)
+        output = capsys.readouterr().out
+
+        assert result == 1
+        assert "not found" in output
+
+    def test_cmd_tasks_cancel_not_running(self, workspace, make_task_file, make_config, capsys):
         """Test cancelling task that is not running."""
-        workspace = temp_dir / "workspace"
         queue_path = workspace / "tasks" / "ad-hoc"
-        queue_path.mkdir(parents=True)
         task_file = queue_path / "task-123.md"
-        task_file.write_text("# Task")
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": str(workspace),
-                "queues": [{"id": "ad-hoc", "path": str(queue_path)}]
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        try:
-            args = MagicMock(config=config_path, task_id="task-123")
-
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                result = cmd_tasks_cancel(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
-
-            assert result == 1
-            assert "not running" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
-
-    def test_cmd_tasks_cancel_with_lock(self, temp_dir):
+        make_task_file(task_file)
+
+        config_path = make_config(workspace, queues=[("ad-hoc", queue_path)])
+
+        args = SimpleNamespace(config=config_path, task_id="task-123")
+
+        result = cmd_tasks_cancel(args)
+        output = capsys.readouterr().out
+
+        assert result == 1
+        assert "not running" in output
+
+    def test_cmd_tasks_cancel_with_lock(self, workspace, make_task_file, make_config, capsys):
         """Test cancelling task with lock file."""
-        workspace = temp_dir / "workspace"
         queue_path = workspace / "tasks" / "ad-hoc"
-        queue_path.mkdir(parents=True)
         task_file = queue_path / "task-123.md"
-        task_file.write_text("# Task")
+        make_task_file(task_file)
 
         # Create lock file
-        from task_monitor.executor import LockInfo, get_lock_file_path
         lock_file = get_lock_file_path(task_file)
-        lock_info = LockInfo(
-            task_id="task-123",
-            worker="ad-hoc",
-            thread_id="12345",
-            pid=999999,  # Non-existent PID
-            started_at="2026-02-07T12:00:00"
-        )
+        lock_info = replace(_LOCK_TEMPLATE, pid=999999)  # Non-existent PID
         lock_info.save(lock_file)
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": str(workspace),
-                "queues": [{"id": "ad-hoc", "path": str(queue_path)}]
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
+        config_path = make_config(workspace, queues=[("ad-hoc", queue_path)])
 
-        try:
-            args = MagicMock(config=config_path, task_id="task-123")
+        args = SimpleNamespace(config=config_path, task_id="task-123")
 
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
+        result = cmd_tasks_cancel(args)
+        output = capsys.readouterr().out
 
-            try:
-                result = cmd_tasks_cancel(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
-
-            # Task should be cancelled (stale lock removed)
-            assert result == 0 or result == 1  # Depends on whether process exists
-        finally:
-            Path(config_path).unlink(missing_ok=True)
+        # Task should be cancelled (stale lock removed)
+        assert result == 0 or result == 1  # Depends on whether process exists
 
 
 class TestCmdWorkersStatus:
     """Tests for cmd_workers_status command."""
 
-    def test_cmd_workers_status_no_workspace(self, temp_dir):
+    def test_cmd_workers_status_no_workspace(self, make_config, capsys):
         """Test workers status with no workspace."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": None,
-                "queues": []
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        try:
-            args = MagicMock(config=config_path)
-
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                result = cmd_workers_status(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
-
-            assert result == 1
-            assert "No Project Workspace" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
-
-    def test_cmd_workers_status_no_queues(self, temp_dir):
+        config_path = make_config(None)
+
+        args = SimpleNamespace(config=config_path)
+
+        result = cmd_workers_status(args)
+        output = capsys.readouterr().out
+
+        assert result == 1
+        assert "No Project Workspace" in output
+
+    def test_cmd_workers_status_no_queues(self, workspace, make_config, capsys):
         """Test workers status with no queues."""
-        workspace = temp_dir / "workspace"
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": str(workspace),
-                "queues": []
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        try:
-            args = MagicMock(config=config_path)
-
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                result = cmd_workers_status(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
-
-            assert result == 0
-            assert "No Task Source Directories" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
-
-    def test_cmd_workers_status_with_queues(self, temp_dir):
-        """Test workers status with queues configured."""
-        workspace = temp_dir / "workspace"
-        queue_path = workspace / "tasks" / "ad-hoc"
-        queue_path.mkdir(parents=True)
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": str(workspace),
-                "queues": [{"id": "ad-hoc", "path": str(queue_path)}]
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        try:
-            args = MagicMock(config=config_path)
-
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                result = cmd_workers_status(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
-
-            assert result == 0
-            assert "Worker Status" in output
-            assert "ad-hoc" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
+        config_path = make_config(workspace)
 
+        args = SimpleNamespace(config=config_path)
 
-class TestCmdWorkersList:
-    """Tests for cmd_workers_list command."""
+        result = cmd_workers_status(args)
+        output = capsys.readouterr().out
 
-    def test_cmd_workers_list_no_queues(self, temp_dir):
-        """Test workers list with no queues."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": None,
-                "queues": []
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        try:
-            args = MagicMock(config=config_path)
-
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                result = cmd_workers_list(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
-
-            assert result == 0
-            assert "Workers:" in output
-            assert "(none)" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
-
-    def test_cmd_workers_list_with_queues(self, temp_dir):
-        """Test workers list with queues configured."""
-        workspace = temp_dir / "workspace"
-        queue_path = workspace / "tasks" / "ad-hoc"
-        queue_path.mkdir(parents=True)
+        assert result == 0
+        assert "No Task Source Directories" in output
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": str(workspace),
-                "queues": [{"id": "ad-hoc", "path": str(queue_path)}]
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
+    def test_cmd_workers_status_with_queues(self, workspace, make_config, capsys):
+        """Test workers status with queues configured."""
+        queue_path = workspace / "tasks" / "ad-hoc"
 
-        try:
-            args = MagicMock(config=config_path)
+        config_path = make_config(workspace, queues=[("ad-hoc", queue_path)])
 
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
+        args = SimpleNamespace(config=config_path)
 
-            try:
-                result = cmd_workers_list(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
+        result = cmd_workers_status(args)
+        output = capsys.readouterr().out
 
-            assert result == 0
-            assert "ad-hoc" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
+        assert result == 0
+        assert "Worker Status" in output
+        assert "ad-hoc" in output
 
 
-class TestCmdLogs:
-    """Tests for cmd_logs command."""
+class TestCmdWorkersList:
+    """Tests for cmd_workers_list command."""
 
-    def test_cmd_logs_with_lines(self, capsys):
-        """Test logs command with --lines flag."""
-        args = MagicMock(
-            follow=False,
-            lines=10
-        )
+    def test_cmd_workers_list_no_queues(self, make_config, capsys):
+        """Test workers list with no queues."""
+        config_path = make_config(None)
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
+        args = SimpleNamespace(config=config_path)
 
-            result = cmd_logs(args)
+        result = cmd_workers_list(args)
+        output = capsys.readouterr().out
 
-            assert result == 0
-            mock_run.assert_called_once()
-            call_args = mock_run.call_args[0][0]
-            assert "journalctl" in call_args
-            assert "-n" in call_args
-            assert "10" in call_args
+        assert result == 0
+        assert "Workers:" in output
+        assert "(none)" in output
 
-    def test_cmd_logs_follow(self):
-        """Test logs command with --follow flag."""
-        args = MagicMock(
-            follow=True,
-            lines=None
-        )
+    def test_cmd_workers_list_with_queues(self, workspace, make_config, capsys):
+        """Test workers list with queues configured."""
+        queue_path = workspace / "tasks" / "ad-hoc"
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
+        config_path = make_config(workspace, queues=[("ad-hoc", queue_path)])
 
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
+        args = SimpleNamespace(config=config_path)
 
-            try:
-                result = cmd_logs(args)
-            finally:
-                sys.stdout = old_stdout
+        result = cmd_workers_list(args)
+        output = capsys.readouterr().out
 
-            assert result == 0
-            mock_run.assert_called_once()
+        assert result == 0
+        assert "ad-hoc" in output
 
-    def test_cmd_logs_default(self):
-        """Test logs command with default options."""
-        args = MagicMock(
-            follow=False,
-            lines=None
-        )
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
+class TestCmdLogs:
+    """Tests for cmd_logs command."""
 
-            result = cmd_logs(args)
+    @pytest.fixture
+    def mock_subprocess_run(self, monkeypatch):
+        """Replace subprocess.run with a mock reporting success."""
+        mock_run = MagicMock(return_value=SimpleNamespace(returncode=0))
+        monkeypatch.setattr("task_monitor.cli.subprocess.run", mock_run)
+        return mock_run
+
+    @pytest.mark.parametrize(
+        "follow,lines,expected_flag",
+        [(False, 10, "-n"), (True, None, "--follow"), (False, None, None)],
+        ids=["with_lines", "follow", "default"],
+    )
+    def test_cmd_logs(self, mock_subprocess_run, follow, lines, expected_flag):
+        """Test logs command with --lines, --follow and default options."""
+        args = SimpleNamespace(
+            follow=follow,
+            lines=lines
+        )
 
-            assert result == 0
-            mock_run.assert_called_once()
+        result = cmd_logs(args)
+
+        assert result == 0
+        mock_subprocess_run.assert_called_once()
+        call_args = mock_subprocess_run.call_args[0][0]
+        assert "journalctl" in call_args
+        if expected_flag:
+            assert expected_flag in call_args
+        else:
+            assert "--follow" not in call_args
+        if lines:
+            assert str(lines) in call_args
@@ -6,286 +6,200 @@ coverage from 50% to 70%+.
 """
 
 import pytest
-import tempfile
 import subprocess
 import json
-from pathlib import Path
-from unittest.mock import patch, MagicMock, call
-from io import StringIO
 import sys
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch, MagicMock, call
 
 from task_monitor.cli import (
     cmd_status, cmd_queues_add, cmd_queues_list, cmd_queues_rm,
-    cmd_run, _restart_daemon, main
+    cmd_run, _restart_daemon, _build_parser, main
+)
+
+
+# Settings matching the MonitorSettings defaults.
+_BASE_SETTINGS = MappingProxyType({
+    "watch_enabled": True,
+    "watch_debounce_ms": 500,
+    "watch_patterns": ["task-*.md"],
+    "watch_recursive": False,
+    "max_attempts": 3,
+    "enable_file_hash": True
+})
+
+# Config template; tests override the fields they vary with {**_BASE_CONFIG, ...}.
+_BASE_CONFIG = MappingProxyType({
+    "version": "2.0",
+    "settings": dict(_BASE_SETTINGS),
+    "project_workspace": None,
+    "queues": []
+})
+
+# Command _restart_daemon runs through subprocess.run.
+_EXPECTED_SYSTEMCTL_CMD = ("systemctl", "--user", "restart", "task-queue.service")
+
+# Failure raised by the faked systemctl call.
+_SYSTEMCTL_FAIL = subprocess.CalledProcessError(
+    returncode=1,
+    cmd=list(_EXPECTED_SYSTEMCTL_CMD),
+    stderr="Unit task-queue.service not found"
 )
-from task_monitor.config import ConfigManager, DEFAULT_CONFIG_FILE
+
+# Body for task files that cmd_run actually executes.
+_TASK_PAYLOAD = b"# Test task"
+
+# The base config never changes, so encode it once for tests that use it as-is.
+_EMPTY_CFG_BYTES = json.dumps(dict(_BASE_CONFIG)).encode()
+
+
+def _args(**kwargs):
+    """Build a parsed-args stand-in carrying only the given attributes."""
+    return SimpleNamespace(**kwargs)
+
+
+@pytest.fixture
+def empty_config(tmp_path):
+    """Write the base config (no workspace, no queues) from its pre-encoded bytes."""
+    config_path = tmp_path / "config.json"
+    config_path.write_bytes(_EMPTY_CFG_BYTES)
+    return str(config_path)
 
 
 class TestRestartDaemon:
     """Tests for _restart_daemon helper function."""
 
-    def test_restart_daemon_success(self):
+    def test_restart_daemon_success(self, monkeypatch):
         """Test successful daemon restart."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="",
-                stderr=""
-            )
-
-            result = _restart_daemon()
-
-            assert result is True
-            mock_run.assert_called_once_with(
-                ["systemctl", "--user", "restart", "task-queue.service"],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-
-    def test_restart_daemon_called_process_error(self, capsys):
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append((cmd, kwargs))
+            return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+
+        result = _restart_daemon()
+
+        assert result is True
+        assert calls == [(
+            list(_EXPECTED_SYSTEMCTL_CMD),
+            {"check": True, "capture_output": True, "text": True}
+        )]
+
+    def test_restart_daemon_called_process_error(self, monkeypatch, capsys):
         """Test restart daemon handles CalledProcessError."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(
-                returncode=1,
-                cmd=["systemctl", "--user", "restart", "task-queue.service"],
-                stderr="Unit task-queue.service not found"
-            )
+        def fake_run(cmd, **kwargs):
+            raise _SYSTEMCTL_FAIL
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
 
-            result = _restart_daemon()
+        result = _restart_daemon()
 
-            assert result is False
+        assert result is False
 
-            captured = capsys.readouterr()
-            assert "Failed to restart daemon" in captured.out
+        captured = capsys.readouterr()
+        assert "Failed to restart daemon" in captured.out
+        assert _SYSTEMCTL_FAIL.stderr in captured.out
 
-    def test_restart_daemon_generic_exception(self, capsys):
+    def test_restart_daemon_generic_exception(self, monkeypatch, capsys):
         """Test restart daemon handles generic exceptions."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.side_effect = RuntimeError("Unexpected error")
+        def fake_run(cmd, **kwargs):
+            raise RuntimeError("Unexpected error")
 
-            result = _restart_daemon()
+        monkeypatch.setattr(subprocess, "run", fake_run)
 
-            assert result is False
+        result = _restart_daemon()
 
-            captured = capsys.readouterr()
-            assert "Failed to restart daemon" in captured.out
+        assert result is False
+
+        captured = capsys.readouterr()
+        assert "Failed to restart daemon" in captured.out
 
 
 class TestCmdStatusEdgeCases:
     """Tests for cmd_status edge cases and error handling."""
 
-    @pytest.fixture
-    def mock_args(self):
-        """Create mock args namespace."""
-        return MagicMock(config=None)
+    def test_cmd_status_no_project_workspace(self, empty_config, temp_dir, capsys):
+        """Test cmd_status with no project workspace set."""
+        args = _args(config=empty_config, detailed=False)
 
-    def test_cmd_status_config_load_error(self, mock_args, capsys):
-        """Test cmd_status handles config loading errors."""
-        # Use non-existent config path
-        mock_args.config = "/nonexistent/config.json"
+        result = cmd_status(args)
+        output = capsys.readouterr().out
 
-        result = cmd_status(mock_args)
+        assert result == 0
+        assert "No Project Workspace set" in output
+        assert "Use 'task-queue init'" in output
 
-        assert result == 1
+    def test_cmd_status_no_queues(self, config_factory, temp_dir, capsys):
+        """Test cmd_status with no source directories configured."""
+        workspace = temp_dir / "ws_status_nosources"
+        (workspace / "tasks").mkdir(parents=True)
 
-        captured = capsys.readouterr()
-        assert "Error loading configuration" in captured.err
+        config_path = config_factory({**_BASE_CONFIG, "project_workspace": str(workspace)})
 
-    def test_cmd_status_no_project_workspace(self, temp_dir):
-        """Test cmd_status with no project workspace set."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {
-                    "watch_enabled": True,
-                    "watch_debounce_ms": 500,
-                    "watch_patterns": ["task-*.md"],
-                    "watch_recursive": False,
-                    "max_attempts": 3,
-                    "enable_file_hash": True
-                },
-                "project_workspace": None,  # No workspace set
-                "queues": []
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        try:
-            args = MagicMock(config=config_path)
-
-            # Capture output
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                result = cmd_status(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
+        args = _args(config=config_path, detailed=False)
 
-            assert result == 0
-            assert "No Project Workspace set" in output
-            assert "Use 'task-queue init'" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
+        result = cmd_status(args)
+        output = capsys.readouterr().out
 
-    def test_cmd_status_no_queues(self, temp_dir):
-        """Test cmd_status with no source directories configured."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-            (workspace / "tasks").mkdir()
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                config = {
-                    "version": "2.0",
-                    "settings": {
-                        "watch_enabled": True,
-                        "watch_debounce_ms": 500,
-                        "watch_patterns": ["task-*.md"],
-                        "watch_recursive": False,
-                        "max_attempts": 3,
-                        "enable_file_hash": True
-                    },
-                    "project_workspace": str(workspace),
-                    "queues": []  # No sources
-                }
-                json.dump(config, f)
-                f.flush()
-                config_path = f.name
-
-            try:
-                args = MagicMock(config=config_path)
-
-                old_stdout = sys.stdout
-                sys.stdout = StringIO()
-
-                try:
-                    result = cmd_status(args)
-                    output = sys.stdout.getvalue()
-                finally:
-                    sys.stdout = old_stdout
-
-                assert result == 0
-                assert "No Task Source Directories configured" in output
-            finally:
-                Path(config_path).unlink(missing_ok=True)
-
-    def test_cmd_status_with_tasks(self, temp_dir):
+        assert result == 0
+        assert "No Task Source Directories configured" in output
+
+    def test_cmd_status_with_tasks(self, config_factory, temp_dir, capsys):
         """Test cmd_status shows task statistics."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-            queue_path = workspace / "tasks" / "ad-hoc"
-            task_dir = queue_path / "pending"
-            task_dir.mkdir(parents=True)
-            (queue_path / "completed").mkdir(exist_ok=True)
-            (queue_path / "failed").mkdir(exist_ok=True)
-
-            # Create some task files
-            (task_dir / "task-20260206-120000-pending.md").write_text("# Pending task")
-            (task_dir / "task-20260206-120001-completed.md").write_text("# Completed task")
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                config = {
-                    "version": "2.0",
-                    "settings": {
-                        "watch_enabled": True,
-                        "watch_debounce_ms": 500,
-                        "watch_patterns": ["task-*.md"],
-                        "watch_recursive": False,
-                        "max_attempts": 3,
-                        "enable_file_hash": True
-                    },
-                    "project_workspace": str(workspace),
-                    "queues": [
-                        {
-                            "id": "main",
-                            "path": str(queue_path),
-                            "description": "Main source"
-                        }
-                    ]
-                }
-                json.dump(config, f)
-                f.flush()
-                config_path = f.name
-
-            try:
-                args = MagicMock(config=config_path, detailed=False)
-
-                old_stdout = sys.stdout
-                sys.stdout = StringIO()
-
-                try:
-                    result = cmd_status(args)
-                    output = sys.stdout.getvalue()
-                finally:
-                    sys.stdout = old_stdout
-
-                assert result == 0
-                assert "Overall Statistics" in output
-                assert "Pending:" in output
-                assert "Per-Source Summary" in output
-                assert "main" in output
-            finally:
-                Path(config_path).unlink(missing_ok=True)
+        workspace = temp_dir / "ws_status_tasks"
+        queue_path = workspace / "tasks" / "ad-hoc"
+        task_dir = queue_path / "pending"
+        task_dir.mkdir(parents=True)
+        (queue_path / "completed").mkdir(exist_ok=True)
+        (queue_path / "failed").mkdir(exist_ok=True)
+
+        # Create some task files (only enumerated, so they can be empty)
+        for name in ("task-20260206-120000-pending.md", "task-20260206-120001-completed.md"):
+            (task_dir / name).touch()
+
+        config = {
+            **_BASE_CONFIG,
+            "project_workspace": str(workspace),
+            "queues": [
+                {"id": "main", "path": str(queue_path), "description": "Main source"}
+            ],
+        }
+        config_path = config_factory(config)
+
+        args = _args(config=config_path, detailed=False)
+
+        result = cmd_status(args)
+        output = capsys.readouterr().out
+
+        assert result == 0
+        assert "Overall Statistics" in output
+        assert "Pending:" in output
+        assert "Per-Source Summary" in output
+        assert "main" in output
 
 
 class TestCmdListQueuesEdgeCases:
     """Tests for cmd_queues_list edge cases."""
 
-    def test_cmd_queues_list_empty(self, temp_dir):
+    def test_cmd_queues_list_empty(self, empty_config, temp_dir, capsys):
         """Test queues list with no sources configured."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {
-                    "watch_enabled": True,
-                    "watch_debounce_ms": 500,
-                    "watch_patterns": ["task-*.md"],
-                    "watch_recursive": False
-                },
-                "project_workspace": None,
-                "queues": []
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        try:
-            args = MagicMock(config=config_path)
-
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                result = cmd_queues_list(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
-
-            assert result == 0
-            assert "Task Source Directories:" in output
-            assert "(none)" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
-
-    def test_cmd_queues_list_config_error(self, capsys):
-        """Test queues list handles config errors."""
-        args = MagicMock(config="/nonexistent/config.json")
+        args = _args(config=empty_config)
 
         result = cmd_queues_list(args)
+        output = capsys.readouterr().out
 
-        assert result == 1
-        captured = capsys.readouterr()
-        assert "Error loading configuration" in captured.err
+        assert result == 0
+        assert "Task Source Directories:" in output
+        assert "(none)" in output
 
 
 class TestCmdRun:
     """Tests for cmd_run command."""
 
     @pytest.fixture
-    def run_config(self, temp_dir):
+    def run_config(self, config_factory, temp_dir):
         """Create a config for run command testing."""
         workspace = temp_dir / "workspace"
         queue_path = workspace / "tasks" / "ad-hoc"
@@ -294,128 +208,67 @@ class TestCmdRun:
         (queue_path / "completed").mkdir(exist_ok=True)
         (queue_path / "failed").mkdir(exist_ok=True)
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {
-                    "watch_enabled": True,
-                    "watch_debounce_ms": 500,
-                    "watch_patterns": ["task-*.md"],
-                    "watch_recursive": False
-                },
-                "project_workspace": str(workspace),
-                "queues": [
-                    {
-                        "id": "main",
-                        "path": str(queue_path),
-                        "description": "Main source"
-                    }
-                ]
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        yield config_path, workspace, task_dir
-
-        Path(config_path).unlink(missing_ok=True)
-
-    def test_cmd_run_no_workspace(self):
-        """Test cmd_run with no workspace configured."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": None,
-                "queues": []
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        try:
-            args = MagicMock(config=config_path)
-
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                result = cmd_run(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
-
-            assert result == 1
-            assert "No Project Workspace set" in output
-        finally:
-            Path(config_path).unlink(missing_ok=True)
-
-    def test_cmd_run_no_pending_tasks(self, run_config):
-        """Test cmd_run with no pending tasks."""
-        config_path, workspace, task_dir = run_config
-
-        args = MagicMock(config=config_path, cycles=1)
-
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-
-        try:
-            result = cmd_run(args)
-            output = sys.stdout.getvalue()
-        finally:
-            sys.stdout = old_stdout
+        config = {
+            **_BASE_CONFIG,
+            "project_workspace": str(workspace),
+            "queues": [
+                {"id": "main", "path": str(queue_path), "description": "Main source"}
+            ],
+        }
+        config_path = config_factory(config)
 
-        assert result == 0
-        assert "All tasks processed" in output
+        return config_path, workspace, task_dir
 
-    def test_cmd_run_with_cycles(self, run_config):
-        """Test cmd_run with specified cycle count."""
-        config_path, workspace, task_dir = run_config
-
-        # Create a task file
-        (task_dir / "task-20260206-120000-test.md").write_text("# Test task")
-
-        args = MagicMock(config=config_path, cycles=2)
-
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
+    def test_cmd_run_no_workspace(self, empty_config, capsys):
+        """Test cmd_run with no workspace configured."""
+        args = _args(config=empty_config)
 
-        try:
-            result = cmd_run(args)
-            output = sys.stdout.getvalue()
-        finally:
-            sys.stdout = old_stdout
+        result = cmd_run(args)
+        output = capsys.readouterr().out
 
-        assert result == 0
-        assert "Cycle 1" in output
-
-    def test_cmd_run_zero_cycles(self, run_config):
-        """Test cmd_run with cycles=0 (infinite mode, but stops when done)."""
+        assert result == 1
+        assert "No Project Workspace set" in output
+
+    @pytest.mark.parametrize(
+        "cycles, create_task, expected_fragment",
+        [
+            (1, False, "All tasks processed"),
+            (2, True, "Cycle 1"),
+            # cycles=0 is infinite mode, but stops when no tasks remain
+            (0, False, "All tasks processed"),
+            (1, True, None),
+        ],
+        ids=["no_pending_tasks", "with_cycles", "zero_cycles", "with_task_execution"],
+    )
+    def test_cmd_run_cycles(self, run_config, capsys, cycles, create_task, expected_fragment):
+        """Test cmd_run over cycle counts with and without a pending task."""
         config_path, workspace, task_dir = run_config
 
-        args = MagicMock(config=config_path, cycles=0)
+        if create_task:
+            # Executed for real, so give it a task body
+            (task_dir / "task-20260206-120000-test.md").write_bytes(_TASK_PAYLOAD)
 
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
+        args = _args(config=config_path, cycles=cycles)
 
-        try:
-            result = cmd_run(args)
-            output = sys.stdout.getvalue()
-        finally:
-            sys.stdout = old_stdout
+        result = cmd_run(args)
+        output = capsys.readouterr().out
 
-        # Should exit when no tasks
-        assert result == 0
-        assert "All tasks processed" in output
+        if expected_fragment is None:
+            # Executing a task fails without an API key; the command must
+            # still complete without crashing (0=success, 1=error but handled)
+            assert result == 0 or result == 1
+        else:
+            assert result == 0
+            assert expected_fragment in output
 
-    def test_cmd_run_keyboard_interrupt(self, run_config):
+    def test_cmd_run_keyboard_interrupt(self, run_config, capsys):
         """Test cmd_run handles KeyboardInterrupt."""
         config_path, workspace, task_dir = run_config
 
-        # Create a task file
-        (task_dir / "task-20260206-120000-test.md").write_text("# Test task")
+        # Create a task file (TaskRunner is mocked, so it is never read)
+        (task_dir / "task-20260206-120000-test.md").touch()
 
-        args = MagicMock(config=config_path, cycles=999)
+        args = _args(config=config_path, cycles=999)
 
         # Mock pick_next_task to raise KeyboardInterrupt after first call
         with patch('task_monitor.cli.TaskRunner') as mock_runner_class:
@@ -423,179 +276,101 @@ class TestCmdRun:
             mock_runner_class.return_value = mock_runner
 
             # First call returns a task, second raises KeyboardInterrupt
-            mock_task = MagicMock()
-            mock_task.name = "task-20260206-120000-test.md"
-            # Set the path to include the queue id for queue determination
-            mock_task.__str__ = lambda self: str(workspace / "tasks" / "main" / "pending" / "task-20260206-120000-test.md")
-            mock_task.__truediv__ = lambda self, other: Path(str(workspace / "tasks" / "main" / "pending")) / other
+            mock_task = SimpleNamespace(name="task-20260206-120000-test.md")
             mock_runner.pick_next_task.side_effect = [mock_task, KeyboardInterrupt()]
 
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                result = cmd_run(args)
-                output = sys.stdout.getvalue()
-            finally:
-                sys.stdout = old_stdout
+            result = cmd_run(args)
+            output = capsys.readouterr().out
 
             assert result == 0
             # Note: The error message "Could not determine queue" appears before the interrupt
             assert "Interrupted" in output or "Error:" in output
 
-    def test_cmd_run_exception_handling(self, run_config):
+    def test_cmd_run_exception_handling(self, run_config, capsys):
         """Test cmd_run handles exceptions."""
         config_path, workspace, task_dir = run_config
 
-        args = MagicMock(config=config_path, cycles=1)
+        args = _args(config=config_path, cycles=1)
 
         # Mock TaskRunner to raise exception
         with patch('task_monitor.cli.TaskRunner') as mock_runner_class:
             mock_runner_class.side_effect = RuntimeError("Test error")
 
-            old_stdout = sys.stdout
-            old_stderr = sys.stderr
-            sys.stdout = StringIO()
-            sys.stderr = StringIO()
-
-            try:
-                result = cmd_run(args)
-                output = sys.stdout.getvalue()
-                error_output = sys.stderr.getvalue()
-            finally:
-                sys.stdout = old_stdout
-                sys.stderr = old_stderr
+            result = cmd_run(args)
+            error_output = capsys.readouterr().err
 
             assert result == 1
             assert "Error:" in error_output
 
-    def test_cmd_run_with_task_execution(self, run_config):
-        """Test cmd_run executes a task."""
-        config_path, workspace, task_dir = run_config
-
-        # Create a task file
-        task_file = task_dir / "task-20260206-120000-test.md"
-        task_file.write_text("# Test task")
-
-        args = MagicMock(config=config_path, cycles=1)
-
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-
-        try:
-            result = cmd_run(args)
-            output = sys.stdout.getvalue()
-        finally:
-            sys.stdout = old_stdout
-
-        # Check the result - if execution fails, that's expected without API key
-        # The important thing is that cmd_run completes without crashing
-        assert result == 0 or result == 1  # 0=success, 1=error but handled
-
-        # Task file may or may not exist depending on execution outcome
-        # Without API key, execution will fail but file handling may vary
-        # Just check the command ran without crashing
-
 
 class TestMainFunction:
     """Tests for main() function."""
 
-    def test_main_no_command(self, capsys):
+    def test_main_no_command(self, monkeypatch, capsys):
         """Test main() with no command (shows help)."""
-        with patch('sys.argv', ['task-queue']):
-            result = main()
+        monkeypatch.setattr(sys, "argv", ['task-queue'])
 
-            assert result == 1
+        result = main()
+
+        assert result == 1
+        assert "usage:" in capsys.readouterr().out
+
+    def test_main_reuses_parser(self):
+        """Test the argument parser is built once and reused."""
+        assert _build_parser() is _build_parser()
 
-    def test_main_with_config_arg(self):
+    def test_main_with_config_arg(self, empty_config, monkeypatch):
         """Test main() with --config argument."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config = {
-                "version": "2.0",
-                "settings": {},
-                "project_workspace": None,
-                "queues": []
-            }
-            json.dump(config, f)
-            f.flush()
-            config_path = f.name
-
-        try:
-            with patch('sys.argv', ['task-queue', '--config', config_path, 'queues', 'list']):
-                old_stdout = sys.stdout
-                sys.stdout = StringIO()
-
-                try:
-                    result = main()
-                finally:
-                    sys.stdout = old_stdout
-
-                assert result == 0
-        finally:
-            Path(config_path).unlink(missing_ok=True)
-
-    def test_main_uses_default_config(self):
-        """Test main() uses default config when not specified."""
-        # Create default config file location
-        default_config = Path.home() / ".config" / "task-queue" / "config.json"
-        default_config.parent.mkdir(parents=True, exist_ok=True)
-
-        try:
-            with open(default_config, 'w') as f:
-                json.dump({
-                    "version": "2.0",
-                    "settings": {},
-                    "project_workspace": None,
-                    "queues": []
-                }, f)
-
-            # Test without --config arg
-            with patch('sys.argv', ['task-queue', 'queues', 'list']):
-                old_stdout = sys.stdout
-                sys.stdout = StringIO()
-
-                try:
-                    result = main()
-                finally:
-                    sys.stdout = old_stdout
-
-                assert result == 0
-        finally:
-            default_config.unlink(missing_ok=True)
-
-
-class TestCmdAddQueueEdgeCases:
-    """Additional tests for cmd_queues_add error handling."""
-
-    def test_cmd_queues_add_exception_handling(self, temp_dir, capsys):
-        """Test cmd_queues_add handles exceptions."""
-        # Use invalid workspace path
-        args = MagicMock(
-            config="/nonexistent/config.json",
-            task_source_dir="/nonexistent/source",
-            project_workspace="/nonexistent/workspace",
-            source_id="test"
-        )
-
-        result = cmd_queues_add(args)
+        monkeypatch.setattr(sys, "argv", ['task-queue', '--config', empty_config, 'queues', 'list'])
 
-        assert result == 1
-        captured = capsys.readouterr()
-        assert "Error:" in captured.err
+        result = main()
 
+        assert result == 0
 
-class TestCmdRemoveQueueEdgeCases:
-    """Additional tests for cmd_queues_rm error handling."""
+    def test_main_uses_default_config(self, _isolated_default_config, tmp_path, monkeypatch, capsys):
+        """Test main() uses default config (TASK_MONITOR_CONFIG) when not specified."""
+        default_config = _isolated_default_config
 
-    def test_cmd_queues_rm_exception_handling(self, capsys):
-        """Test cmd_queues_rm handles exceptions."""
-        args = MagicMock(
-            config="/nonexistent/config.json",
-            source_id="test"
-        )
+        config = {
+            **_BASE_CONFIG,
+            "queues": [{"id": "default-queue", "path": str(tmp_path / "tasks" / "default-queue")}]
+        }
+        default_config.write_text(json.dumps(config), encoding="utf-8")
 
-        result = cmd_queues_rm(args)
+        # Test without --config arg
+        monkeypatch.setattr(sys, "argv", ['task-queue', 'queues', 'list'])
+        result = main()
+
+        assert result == 0
+        assert "default-queue" in capsys.readouterr().out
+
+
+class TestConfigLoadErrors:
+    """Tests for commands given a config file that cannot be loaded."""
+
+    @pytest.mark.parametrize(
+        "cmd, extra_args",
+        [
+            (cmd_status, {"detailed": False}),
+            (cmd_queues_list, {}),
+            (cmd_queues_add, {
+                "queue_path": "/nonexistent/source",
+                "project_workspace": "/nonexistent/workspace",
+                "id": "test",
+                "description": None
+            }),
+            (cmd_queues_rm, {"queue_id": "test"}),
+        ],
+        ids=["status", "queues_list", "queues_add", "queues_rm"],
+    )
+    def test_unloadable_config_returns_error(self, tmp_path, capsys, cmd, extra_args):
+        """Test commands report an error and return 1 when the config cannot be loaded."""
+        # A regular file as parent directory fails even for root, unlike /nonexistent
+        blocker = tmp_path / "not-a-directory"
+        blocker.touch()
+        args = _args(config=str(blocker / "config.json"), **extra_args)
+
+        result = cmd(args)
 
         assert result == 1
-        captured = capsys.readouterr()
-        assert "Error:" in captured.err
+        assert "Error" in capsys.readouterr().err
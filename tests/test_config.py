@@ -48,12 +48,13 @@ class TestConfigManager:
                 "batch_size": 10
             }
         }
-        config_file.write_text(json.dumps(config_data))
+        config_file.write_text(json.dumps(config_data), encoding="utf-8")
 
         # Load config - should use new field names internally
         manager = ConfigManager(config_file)
-        # Note: Old config files may not work directly with new model
-        # In production, migration would be needed
+        assert manager.config.project_workspace == str(tmp_path)
+        assert len(manager.config.queues) == 1
+        assert manager.config.queues[0].id == "main"
 
     def test_load_v2_config(self, config_file, tmp_path):
         """Test loading v2.0 configuration."""
@@ -80,7 +81,7 @@ class TestConfigManager:
                 "enable_file_hash": True
             }
         }
-        config_file.write_text(json.dumps(config_data))
+        config_file.write_text(json.dumps(config_data), encoding="utf-8")
 
         # Load config
         manager = ConfigManager(config_file)
@@ -7,14 +7,22 @@ Tests for edge cases, error handling, and less-covered code paths.
 import pytest
 import tempfile
 import json
+import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from io import StringIO
 import sys
 
-from task_monitor.config import ConfigManager, get_default_config_manager
+from task_monitor.config import ConfigManager, get_default_config_file, get_default_config_manager
 from task_monitor.models import Queue, MonitorConfig
 from task_monitor.constants import DEFAULT_CONFIG_FILE
+from task_monitor.file_utils import AtomicFileWriter
+
+
+@pytest.fixture(scope="module")
+def readonly_manager(tmp_path_factory):
+    """ConfigManager with a default config, shared by tests that never mutate it."""
+    return ConfigManager(tmp_path_factory.mktemp("readonly") / "config.json")
 
 
 class TestConfigManagerMigration:
@@ -77,7 +85,7 @@ class TestConfigManagerMigration:
         # Should create default config
         assert manager.config is not None
 
-    def test_save_config_lock_timeout(self, temp_dir):
+    def test_save_config_lock_timeout(self, temp_dir, monkeypatch):
         """Test save_config raises RuntimeError when lock can't be acquired."""
         config_file = temp_dir / "config.json"
         lock_file = temp_dir / "config.lock"
@@ -87,10 +95,10 @@ class TestConfigManagerMigration:
         # Acquire lock externally to simulate contention
         lock_file.touch()
 
-        # Mock acquire to return False
-        with patch.object(manager.lock, 'acquire', return_value=False):
-            with pytest.raises(RuntimeError, match="Could not acquire config lock"):
-                manager.save_config()
+        # Stub acquire to time out (plain function, no MagicMock)
+        monkeypatch.setattr(manager.lock, "acquire", lambda *args, **kwargs: False)
+        with pytest.raises(RuntimeError, match="Could not acquire config lock"):
+            manager.save_config()
 
     def test_reload(self, temp_dir):
         """Test reload method."""
@@ -143,12 +151,9 @@ class TestConfigManagerMigration:
         assert queue.id == "test-queue"
         assert queue.description == "Test queue"
 
-    def test_get_queue_not_found(self, temp_dir):
+    def test_get_queue_not_found(self, readonly_manager):
         """Test get_queue with non-existent ID."""
-        config_file = temp_dir / "config.json"
-        manager = ConfigManager(config_file)
-
-        queue = manager.get_queue("nonexistent")
+        queue = readonly_manager.get_queue("nonexistent")
         assert queue is None
 
     def test_update_settings_valid(self, temp_dir):
@@ -164,13 +169,18 @@ class TestConfigManagerMigration:
         assert manager.config.settings.watch_enabled is False
         assert manager.config.settings.watch_debounce_ms == 1000
 
-    def test_update_settings_invalid(self, temp_dir):
+    def test_update_settings_invalid(self, readonly_manager):
         """Test update_settings with invalid setting raises ValueError."""
-        config_file = temp_dir / "config.json"
-        manager = ConfigManager(config_file)
-
         with pytest.raises(ValueError, match="Unknown setting"):
-            manager.update_settings(invalid_setting=True)
+            readonly_manager.update_settings(invalid_setting=True)
+
+    @pytest.mark.parametrize("key", ["invalid_setting", "model_dump"])
+    def test_update_settings_invalid_applies_nothing(self, readonly_manager, key):
+        """Test an unknown key (even a model attribute) rejects the whole update."""
+        with pytest.raises(ValueError, match=f"Unknown setting: {key}"):
+            readonly_manager.update_settings(watch_debounce_ms=1, **{key: True})
+
+        assert readonly_manager.config.settings.watch_debounce_ms == 500
 
     def test_acquire_lock(self, temp_dir):
         """Test acquire_lock method."""
@@ -195,11 +205,196 @@ class TestConfigManagerMigration:
         assert manager.acquire_lock(timeout=1.0) is True
         manager.release_lock()
 
-    def test_get_default_config_manager(self):
-        """Test get_default_config_manager function."""
+    def test_lock_created_on_first_use(self, temp_dir):
+        """Test the FileLock is built lazily and then reused by the manager."""
+        manager = ConfigManager(temp_dir / "config.json")
+        assert "lock" not in vars(manager)
+
+        assert manager.lock is manager.lock
+        assert manager.lock.lockfile == temp_dir / "config.lock"
+
+    def test_get_default_config_manager(self, _isolated_default_config):
+        """Test get_default_config_manager honours TASK_MONITOR_CONFIG."""
         manager = get_default_config_manager()
         assert isinstance(manager, ConfigManager)
-        assert manager.config_file == DEFAULT_CONFIG_FILE
+        assert manager.config_file == _isolated_default_config
+        assert ConfigManager().config_file == _isolated_default_config
+
+    def test_default_config_file_without_override(self, monkeypatch):
+        """Test the default path is used when TASK_MONITOR_CONFIG is unset or empty."""
+        monkeypatch.setenv("TASK_MONITOR_CONFIG", "")
+        assert get_default_config_file() == DEFAULT_CONFIG_FILE
+        monkeypatch.delenv("TASK_MONITOR_CONFIG")
+        assert get_default_config_file() == DEFAULT_CONFIG_FILE
+
+
+def test_config_import_does_not_load_sdk_or_watchdog():
+    """Test importing task_monitor.config leaves executor and watchdog unloaded."""
+    import subprocess
+
+    code = (
+        "import sys, task_monitor.config; "
+        "print(any(m in sys.modules for m in "
+        "('task_monitor.executor', 'task_monitor.watchdog', 'watchdog')))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+class TestConfigParseCache:
+    """Tests for the stat-signature keyed parse cache."""
+
+    @pytest.fixture
+    def saved_config(self, temp_dir):
+        """Write a config with one queue and return its path."""
+        config_file = temp_dir / "config.json"
+        queue_path = temp_dir / "queue"
+        queue_path.mkdir()
+        ConfigManager(config_file).add_queue(path=str(queue_path), id="cached")
+        return config_file
+
+    def test_unchanged_file_skips_read(self, saved_config):
+        """Test a second manager on an unchanged file reuses the parsed config."""
+        first = ConfigManager(saved_config)
+
+        with patch("task_monitor.config.AtomicFileWriter.read_json") as mock_read:
+            second = ConfigManager(saved_config)
+
+        mock_read.assert_not_called()
+        assert second.config == first.config
+        # Each manager gets its own copy
+        second.config.queues.clear()
+        assert len(first.config.queues) == 1
+
+    def test_save_refreshes_cache(self, saved_config):
+        """Test save_config caches what it wrote, so the next load skips the read."""
+        manager = ConfigManager(saved_config)
+        manager.remove_queue("cached")
+
+        with patch("task_monitor.config.AtomicFileWriter.read_json") as mock_read:
+            reloaded = ConfigManager(saved_config)
+
+        mock_read.assert_not_called()
+        assert reloaded.config.queues == []
+
+    def test_external_write_after_save_misses_cache(self, saved_config):
+        """Test a file rewritten after save_config is re-read, not served stale."""
+        data = json.loads(saved_config.read_text())
+        data["queues"] = []
+        saved_config.write_text(json.dumps(data))
+
+        assert ConfigManager(saved_config).config.queues == []
+
+    def test_same_size_rewrite_in_same_mtime_tick_misses_cache(self, saved_config, temp_dir):
+        """Test a replaced file with identical size and mtime is still re-read."""
+        ConfigManager(saved_config)
+        original = saved_config.stat()
+        replacement = temp_dir / "replacement.json"
+        replacement.write_text(saved_config.read_text().replace('"cached"', '"cachex"'))
+        os.utime(replacement, ns=(original.st_atime_ns, original.st_mtime_ns))
+        os.replace(replacement, saved_config)
+        assert saved_config.stat().st_size == original.st_size
+
+        assert [q.id for q in ConfigManager(saved_config).config.queues] == ["cachex"]
+
+    def test_reload_unchanged_file_skips_read(self, saved_config):
+        """Test reload rebuilds the config from cached data when the file is unchanged."""
+        manager = ConfigManager(saved_config)
+        config = manager.config
+
+        with patch("task_monitor.config.AtomicFileWriter.read_json") as mock_read:
+            manager.reload()
+
+        mock_read.assert_not_called()
+        assert manager.config is not config
+        assert manager.config == config
+
+    def test_reload_discards_unsaved_changes(self, saved_config, temp_dir):
+        """Test reload drops direct in-memory edits even when the file is unchanged."""
+        manager = ConfigManager(saved_config)
+        extra = temp_dir / "extra"
+        extra.mkdir()
+        manager.config.add_queue(path=str(extra), id="extra")
+
+        manager.reload()
+
+        assert [q.id for q in manager.config.queues] == ["cached"]
+
+    def test_reload_changed_file_rereads(self, saved_config):
+        """Test reload re-reads the file after an external edit."""
+        manager = ConfigManager(saved_config)
+        data = json.loads(saved_config.read_text())
+        data["queues"] = []
+        saved_config.write_text(json.dumps(data))
+
+        with patch(
+            "task_monitor.config.AtomicFileWriter.read_json",
+            wraps=AtomicFileWriter.read_json,
+        ) as mock_read:
+            manager.reload()
+
+        mock_read.assert_called_once()
+        assert manager.config.queues == []
+
+
+class TestBatchUpdates:
+    """Tests for ConfigManager.batch_updates save coalescing."""
+
+    @pytest.fixture
+    def dirs(self, temp_dir):
+        """Create a workspace and two queue directories."""
+        paths = [temp_dir / name for name in ("workspace", "queue1", "queue2")]
+        for path in paths:
+            path.mkdir()
+        return paths
+
+    def test_mutations_saved_once(self, temp_dir, dirs):
+        """Test several mutators inside one batch produce a single write."""
+        workspace, queue1, queue2 = dirs
+        manager = ConfigManager(temp_dir / "config.json")
+
+        with patch.object(manager, "save_config", wraps=manager.save_config) as mock_save:
+            with manager.batch_updates():
+                manager.set_project_workspace(str(workspace))
+                manager.add_queue(path=str(queue1), id="q1")
+                manager.add_queue(path=str(queue2), id="q2")
+                mock_save.assert_not_called()
+
+        mock_save.assert_called_once()
+        reloaded = ConfigManager(temp_dir / "config.json").config
+        assert reloaded.project_workspace == str(workspace.resolve())
+        assert [q.id for q in reloaded.queues] == ["q1", "q2"]
+
+    def test_no_write_when_unchanged_or_raised(self, temp_dir, dirs):
+        """Test a clean batch and a batch that raises both skip the write."""
+        _, queue1, _ = dirs
+        manager = ConfigManager(temp_dir / "config.json")
+
+        with patch.object(manager, "save_config") as mock_save:
+            with manager.batch_updates():
+                manager.get_queue("missing")
+            with pytest.raises(ValueError):
+                with manager.batch_updates():
+                    manager.add_queue(path=str(queue1), id="q1")
+                    manager.add_queue(path=str(queue1), id="q1")
+
+        mock_save.assert_not_called()
+
+    def test_raised_batch_discards_pending_changes(self, temp_dir, dirs):
+        """Test changes from a batch that raised are not saved by a later mutator."""
+        _, queue1, queue2 = dirs
+        config_file = temp_dir / "config.json"
+        manager = ConfigManager(config_file)
+
+        with pytest.raises(RuntimeError):
+            with manager.batch_updates():
+                manager.add_queue(path=str(queue1), id="q1")
+                raise RuntimeError("aborted")
+
+        assert manager.config.get_queue("q1") is None
+        manager.add_queue(path=str(queue2), id="q2")
+
+        assert [q.id for q in ConfigManager(config_file).config.queues] == ["q2"]
 
 
 class TestConfigManagerWithExistingData:
@@ -220,12 +415,9 @@ class TestConfigManagerWithExistingData:
         with pytest.raises(ValueError):
             manager.add_queue(path=str(queue2_path), id="test")
 
-    def test_remove_nonexistent_queue(self, temp_dir):
+    def test_remove_nonexistent_queue(self, readonly_manager):
         """Test removing non-existent queue returns False."""
-        config_file = temp_dir / "config.json"
-        manager = ConfigManager(config_file)
-
-        result = manager.remove_queue("nonexistent")
+        result = readonly_manager.remove_queue("nonexistent")
         assert result is False
 
     def test_list_queues(self, temp_dir):
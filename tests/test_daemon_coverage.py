@@ -9,8 +9,12 @@ from pathlib import Path
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 from argparse import Namespace
+from types import SimpleNamespace
 
-from task_monitor.daemon import TaskQueueDaemon, WORKER_KEEPALIVE_TIMEOUT, WORKER_RETRY_DELAY, WORKER_CYCLE_PAUSE
+from task_monitor.daemon import (
+    TaskQueueDaemon, WORKER_KEEPALIVE_TIMEOUT, WORKER_RETRY_DELAY, WORKER_CYCLE_PAUSE,
+    WORKER_SHUTDOWN_TIMEOUT,
+)
 from task_monitor.models import Queue
 
 
@@ -450,6 +454,29 @@ class TestShutdown:
         worker.join()
         assert not worker.is_alive()
 
+    def test_shutdown_timeout_shared_by_stuck_workers(self, monkeypatch):
+        """Test stuck workers share one shutdown deadline instead of one each."""
+        now = [100.0]
+        monkeypatch.setattr("task_monitor.daemon.time", SimpleNamespace(monotonic=lambda: now[0]))
+        daemon = TaskQueueDaemon()
+        join_timeouts = []
+
+        def stuck_join(timeout=None):
+            # A worker that never exits uses up its whole timeout
+            join_timeouts.append(timeout)
+            now[0] += timeout
+
+        for i in range(3):
+            worker = Mock()
+            worker.is_alive.return_value = True
+            worker.join.side_effect = stuck_join
+            daemon._worker_threads[f"source{i}"] = worker
+
+        daemon._shutdown()
+
+        assert len(join_timeouts) == 3
+        assert sum(join_timeouts) == pytest.approx(WORKER_SHUTDOWN_TIMEOUT)
+
     def test_shutdown_with_watchdog(self, temp_dir):
         """Test shutdown stops watchdog manager."""
         config_file = temp_dir / "config.json"
@@ -610,6 +637,8 @@ class TestStartMethod:
         daemon.start()
 
         assert daemon.task_runner is not None
+        # Without the watchdog nothing invalidates listings, so none are cached
+        assert daemon.task_runner.watched_queues == set()
 
 
 class TestRunLoop:
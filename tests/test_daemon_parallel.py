@@ -1,9 +1,8 @@
 """Tests for daemon parallel execution feature."""
 
+import os
 import pytest
-import time
 import threading
-import shutil
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import Mock, patch
@@ -65,7 +64,7 @@ class TestParallelWorkerSetup:
 class TestWorkerLoop:
     """Tests for the worker loop method."""
 
-    def test_worker_loop_processes_single_source(self, temp_dir):
+    def test_worker_loop_processes_single_source(self, temp_dir, monkeypatch):
         """Test that worker loop processes tasks from one source."""
         # Create queue directory with tasks
         queue_path = temp_dir / "tasks" / "ad-hoc"
@@ -96,29 +95,22 @@ class TestWorkerLoop:
         # Create event for this queue
         daemon._source_events["test"] = threading.Event()
 
-        # Mock execute to return success and move to completed
+        monkeypatch.setattr("task_monitor.daemon.WORKER_CYCLE_PAUSE", 0)
+
+        # Mock execute to move to completed, then stop the worker after this task
         def mock_execute(task_file, project_workspace=None, worker=None):
             # Move to completed
             archive_dir = Path(project_workspace) / "tasks" / "ad-hoc" / "completed"
-            shutil.move(str(task_file), str(archive_dir / task_file.name))
+            os.replace(task_file, archive_dir / task_file.name)
+            daemon.shutdown_requested = True
+            daemon._source_events["test"].set()
             from task_monitor.executor import ExecutionResult
             return ExecutionResult(success=True, task_id=task_file.stem)
 
         daemon.task_runner.executor.execute = mock_execute
 
-        # Run worker loop for one iteration
-        def stop_after_one():
-            time.sleep(0.1)
-            daemon.shutdown_requested = True
-            daemon._source_events["test"].set()
-
-        stopper = threading.Thread(target=stop_after_one)
-        stopper.start()
-
         daemon._worker_loop(queue)
 
-        stopper.join()
-
         # Tasks should have been processed
         archive_dir = temp_dir / "tasks" / "ad-hoc" / "completed"
         assert len(list(archive_dir.glob("task-*.md"))) >= 1
@@ -162,8 +154,7 @@ class TestParallelExecutionSimulation:
                 if task:
                     with lock:
                         processed["worker1"].append(task.name)
-                    time.sleep(0.05)  # Simulate work
-                    shutil.move(str(task), str(temp_dir / "tasks" / "ad-hoc" / "completed" / task.name))
+                    os.replace(task, temp_dir / "tasks" / "ad-hoc" / "completed" / task.name)
 
         def worker2():
             """Simulate worker 2 processing queue2."""
@@ -172,19 +163,16 @@ class TestParallelExecutionSimulation:
                 if task:
                     with lock:
                         processed["worker2"].append(task.name)
-                    time.sleep(0.05)  # Simulate work
-                    shutil.move(str(task), str(temp_dir / "tasks" / "ad-hoc" / "completed" / task.name))
+                    os.replace(task, temp_dir / "tasks" / "ad-hoc" / "completed" / task.name)
 
         # Run workers in parallel
         t1 = threading.Thread(target=worker1)
         t2 = threading.Thread(target=worker2)
 
-        start_time = time.time()
         t1.start()
         t2.start()
         t1.join()
         t2.join()
-        elapsed = time.time() - start_time
 
         # Both workers should have processed their tasks
         assert len(processed["worker1"]) == 3
@@ -196,11 +184,6 @@ class TestParallelExecutionSimulation:
         for task in processed["worker2"]:
             assert "s2" in task
 
-        # Parallel execution should be faster than sequential
-        # Sequential: 6 * 0.05 = 0.3 seconds
-        # Parallel: ~3 * 0.05 = 0.15 seconds
-        assert elapsed < 0.25  # Should be significantly faster
-
 
 class TestWatchdogEventSignaling:
     """Tests for per-source watchdog event signaling."""
@@ -233,6 +216,16 @@ class TestWatchdogEventSignaling:
         # Should not crash, source1 should not be set
         assert not daemon._source_events["source1"].is_set()
 
+    def test_watchdog_event_invalidates_pending_listing(self, temp_dir):
+        """Test watchdog events drop the task runner's cached listing for that source."""
+        daemon = TaskQueueDaemon()
+        daemon.task_runner = Mock()
+        daemon._source_events["source1"] = threading.Event()
+
+        daemon._on_watchdog_event("/tmp/task-test.md", "source1")
+
+        daemon.task_runner.invalidate_queue.assert_called_once_with("source1")
+
 
 class TestGracefulShutdown:
     """Tests for graceful shutdown with multiple workers."""
@@ -1,7 +1,9 @@
 """Tests for task_monitor.executor module."""
 
 import pytest
+import errno
 import json
+import os
 import tempfile
 import threading
 from pathlib import Path
@@ -95,6 +97,13 @@ class TestLockInfo:
         lock = LockInfo.from_file(lock_file)
         assert lock is None
 
+    def test_from_file_non_object(self, temp_dir):
+        """Test LockInfo.from_file() with a JSON payload that is not an object."""
+        lock_file = temp_dir / "test.lock"
+        lock_file.write_text(json.dumps(["task-123", "ad-hoc"]))
+
+        assert LockInfo.from_file(lock_file) is None
+
     def test_save(self, temp_dir):
         """Test LockInfo.save() method."""
         lock_file = temp_dir / "test.lock"
@@ -122,6 +131,11 @@ class TestLockFileHelpers:
         lock_path = get_lock_file_path(task_file)
         assert lock_path == Path("/tmp/tasks/pending/.task-123.lock")
 
+    def test_get_lock_file_path_relative(self):
+        """Test get_lock_file_path() keeps relative and bare task paths relative."""
+        assert get_lock_file_path(Path("pending/task-123.md")) == Path("pending/.task-123.lock")
+        assert get_lock_file_path(Path("task-123.md")) == Path(".task-123.lock")
+
     def test_is_task_locked_no_lock_file(self, temp_dir):
         """Test is_task_locked() when no lock file exists."""
         task_file = temp_dir / "task-123.md"
@@ -173,6 +187,24 @@ class TestLockFileHelpers:
         # Lock file should be removed after stale check
         assert not lock_file.exists()
 
+    def test_is_task_locked_live_and_unparseable_locks(self, temp_dir):
+        """Test is_task_locked() treats live and unparseable lock files as held."""
+        task_file = temp_dir / "task-123.md"
+        lock_file = get_lock_file_path(task_file)
+
+        LockInfo(
+            task_id="task-123",
+            worker="ad-hoc",
+            thread_id="12345",
+            pid=os.getpid(),
+            started_at="2026-02-07T12:00:00"
+        ).save(lock_file)
+        assert is_task_locked(task_file) is True
+
+        lock_file.write_text("invalid json")
+        assert is_task_locked(task_file) is True
+        assert lock_file.exists()
+
     def test_get_locked_task_no_locks(self, temp_dir):
         """Test get_locked_task() with no lock files."""
         assert get_locked_task(temp_dir) is None
@@ -192,6 +224,25 @@ class TestLockFileHelpers:
         # Should return None for stale lock
         assert get_locked_task(temp_dir) is None
 
+    def test_get_locked_task_live_lock_among_other_files(self, temp_dir):
+        """Test get_locked_task() skips non-lock entries and finds a live lock."""
+        (temp_dir / "task-123.md").write_text("# Task")
+        (temp_dir / ".task-123.lock.tmp").write_text("{}")
+        lock_data = {
+            "task_id": "task-123",
+            "worker": "ad-hoc",
+            "thread_id": "12345",
+            "pid": os.getpid(),
+            "started_at": "2026-02-07T12:00:00"
+        }
+        (temp_dir / ".task-123.lock").write_text(json.dumps(lock_data))
+
+        assert get_locked_task(temp_dir) == "task-123"
+
+    def test_get_locked_task_missing_directory(self, temp_dir):
+        """Test get_locked_task() returns None for a missing directory."""
+        assert get_locked_task(temp_dir / "missing") is None
+
     def test_process_exists_current_process(self):
         """Test process_exists() with current process."""
         import os
@@ -207,6 +258,32 @@ class TestLockFileHelpers:
         # Test with invalid PID (negative number)
         assert process_exists(-1) is False
 
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="requires pidfd_open")
+    def test_process_exists_thread_id_not_process(self):
+        """Test process_exists() does not report a thread ID as a live process."""
+        results = []
+        worker = threading.Thread(target=lambda: results.append(process_exists(threading.get_native_id())))
+        worker.start()
+        worker.join()
+        assert results == [False]
+
+    def test_process_exists_falls_back_without_pidfd(self, monkeypatch):
+        """Test process_exists() uses /proc when pidfd_open is unavailable."""
+        def unsupported(pid):
+            raise OSError(errno.ENOSYS, "Function not implemented")
+
+        monkeypatch.setattr("task_monitor.executor._pidfd_open", unsupported)
+        assert process_exists(os.getpid()) is True
+        assert process_exists(999999) is False
+
+    def test_process_exists_live_pid_when_pidfd_exhausted(self, monkeypatch):
+        """Test process_exists() does not report a live PID dead when no fd is available."""
+        def out_of_fds(pid):
+            raise OSError(errno.EMFILE, os.strerror(errno.EMFILE))
+
+        monkeypatch.setattr("task_monitor.executor._pidfd_open", out_of_fds)
+        assert process_exists(os.getpid()) is True
+
 
 class TestExecutionResult:
     """Tests for ExecutionResult dataclass."""
@@ -280,6 +357,18 @@ class TestExecutionResult:
         assert data["success"] is True
         assert data["task_id"] == "task-123"
 
+    def test_save_to_file_existing_results_dir(self, temp_dir):
+        """Test save_to_file() writes into an existing results directory without mkdir."""
+        results_dir = temp_dir / "tasks" / "ad-hoc" / "results"
+        results_dir.mkdir(parents=True)
+        result = ExecutionResult(success=False, error="boom", task_id="task-456")
+
+        with patch.object(Path, "mkdir", side_effect=AssertionError("unexpected mkdir")):
+            result_path = result.save_to_file(temp_dir, "ad-hoc")
+
+        assert result_path == results_dir / "task-456.json"
+        assert json.loads(result_path.read_text())["error"] == "boom"
+
 
 class TestSyncTaskExecutor:
     """Tests for SyncTaskExecutor class."""
@@ -289,6 +378,17 @@ class TestSyncTaskExecutor:
         executor = SyncTaskExecutor(temp_dir)
         assert executor.project_workspace == temp_dir.resolve()
 
+    def test_init_relative_workspace_follows_cwd(self, temp_dir, monkeypatch):
+        """Test cached workspace resolution still resolves relative paths per cwd."""
+        for name in ("a", "b"):
+            (temp_dir / name / "proj").mkdir(parents=True)
+
+        monkeypatch.chdir(temp_dir / "a")
+        assert SyncTaskExecutor(Path("proj")).project_workspace == (temp_dir / "a" / "proj").resolve()
+
+        monkeypatch.chdir(temp_dir / "b")
+        assert SyncTaskExecutor(Path("proj")).project_workspace == (temp_dir / "b" / "proj").resolve()
+
     def test_init_without_workspace(self):
         """Test SyncTaskExecutor initialization without workspace."""
         executor = SyncTaskExecutor()
@@ -311,6 +411,16 @@ class TestSyncTaskExecutor:
         with pytest.raises(FileNotFoundError, match="Task document not found"):
             executor.execute(task_file)
 
+    def test_execute_skips_resolve_for_current_workspace(self, temp_dir):
+        """Test execute() does not re-resolve the workspace it already holds."""
+        executor = SyncTaskExecutor(temp_dir)
+
+        with patch.object(Path, "resolve") as mock_resolve:
+            with pytest.raises(FileNotFoundError):
+                executor.execute(temp_dir / "missing.md", project_workspace=executor.project_workspace)
+
+        mock_resolve.assert_not_called()
+
     def test_execute_relative_path_resolved(self, temp_dir):
         """Test execute() resolves relative task paths."""
         executor = SyncTaskExecutor(temp_dir)
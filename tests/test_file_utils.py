@@ -259,6 +259,63 @@ class TestFileLock:
         # All threads should have acquired the lock
         assert len(results) == 3
 
+    def test_in_process_waiter_acquires_after_release(self, tmp_path):
+        """Test a thread waiting on the same path acquires once the holder releases."""
+        lock_file = tmp_path / "test.lock"
+        lock1 = FileLock(lock_file)
+        lock2 = FileLock(lock_file)
+        results = []
+
+        assert lock1.acquire(timeout=1) is True
+        waiter = Thread(target=lambda: results.append(lock2.acquire(timeout=5)))
+        waiter.start()
+        lock1.release()
+        waiter.join()
+
+        assert results == [True]
+        assert lock2.is_locked() is True
+        lock2.release()
+
+    def test_timed_out_acquire_frees_path(self, tmp_path):
+        """Test a timed-out acquire does not keep other instances out."""
+        lock_file = tmp_path / "test.lock"
+        lock1 = FileLock(lock_file)
+        lock2 = FileLock(lock_file)
+
+        assert lock1.acquire(timeout=1) is True
+        assert lock2.acquire(timeout=0.1) is False
+        lock2.release()  # releasing an unacquired lock leaves lock1 held
+        assert FileLock(lock_file).acquire(timeout=0.1) is False
+        lock1.release()
+
+        assert lock2.acquire(timeout=1) is True
+        lock2.release()
+
+    def test_zero_timeout_tries_once(self, tmp_path):
+        """Test acquire(timeout=0) takes a free lock instead of giving up untried."""
+        lock = FileLock(tmp_path / "test.lock")
+        assert lock.acquire(timeout=0) is True
+        lock.release()
+
+    def test_poll_sleep_capped_at_deadline(self, tmp_path, monkeypatch):
+        """Test waiting on another holder never sleeps past the timeout."""
+        import fcntl
+
+        lock_file = tmp_path / "test.lock"
+        # Hold the flock through a separate open file, as another process would
+        holder = open(lock_file, "w")
+        fcntl.flock(holder.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        sleeps = []
+        monkeypatch.setattr(FileLock, "POLL_INTERVAL", 10.0)
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+
+        try:
+            assert FileLock(lock_file).acquire(timeout=0.05) is False
+        finally:
+            holder.close()
+
+        assert sleeps and all(0 < delay <= 0.05 for delay in sleeps)
+
     def test_is_locked_method(self, tmp_path):
         """Test the is_locked method."""
         lock_file = tmp_path / "test.lock"
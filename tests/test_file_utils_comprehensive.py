@@ -11,7 +11,8 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 import os
 
-from task_monitor.file_utils import AtomicFileWriter, FileLock, is_valid_task_id
+from task_monitor import file_utils
+from task_monitor.file_utils import AtomicFileWriter, FileLock, is_valid_task_id, move_file
 
 
 class TestAtomicFileWriterErrorHandling:
@@ -30,8 +31,8 @@ class TestAtomicFileWriterErrorHandling:
         """Test write_json cleans up temp file on error."""
         target_file = temp_dir / "config.json"
 
-        # Mock json.dump to raise exception
-        with patch('json.dump', side_effect=RuntimeError("Write failed")):
+        # Mock the serializer to raise exception
+        with patch('task_monitor.file_utils._dumps', side_effect=RuntimeError("Write failed")):
             with pytest.raises(RuntimeError):
                 AtomicFileWriter.write_json(target_file, {"test": "data"})
 
@@ -43,23 +44,80 @@ class TestAtomicFileWriterErrorHandling:
         """Test write_json handles cleanup failures gracefully."""
         target_file = temp_dir / "config.json"
 
-        # Make json.dump fail, then make unlink fail too
+        # Make the serializer fail, then make unlink fail too
         call_count = [0]
+        original_dumps = file_utils._dumps
 
-        original_dump = json.dump
-
-        def failing_dump(*args, **kwargs):
+        def failing_dumps(*args, **kwargs):
             call_count[0] += 1
             if call_count[0] > 1:
-                return original_dump(*args, **kwargs)
+                return original_dumps(*args, **kwargs)
             raise RuntimeError("Write failed")
 
-        with patch('json.dump', side_effect=failing_dump):
+        with patch('task_monitor.file_utils._dumps', side_effect=failing_dumps):
             with patch.object(Path, 'unlink', side_effect=OSError("Cleanup failed")):
                 # Should still raise the original error
                 with pytest.raises(RuntimeError, match="Write failed"):
                     AtomicFileWriter.write_json(target_file, {"test": "data"})
 
+    def test_write_bytes_retries_short_writes(self, temp_dir, monkeypatch):
+        """Test write_bytes keeps writing until the whole payload is on disk."""
+        target_file = temp_dir / "result.json"
+        payload = b'{"task_id": "task-123", "success": true}'
+        real_write = os.write
+        monkeypatch.setattr(file_utils.os, "write", lambda fd, data: real_write(fd, data[:3]))
+
+        AtomicFileWriter.write_bytes(target_file, payload)
+
+        assert target_file.read_bytes() == payload
+        assert list(temp_dir.glob(".result.json.*.tmp")) == []
+
+    def test_write_bytes_error_cleans_temp_file(self, temp_dir, monkeypatch):
+        """Test write_bytes removes its temp file when the fsync fails."""
+        target_file = temp_dir / "result.json"
+
+        def failing_fsync(fd):
+            raise OSError("fsync failed")
+
+        monkeypatch.setattr(file_utils.os, "fsync", failing_fsync)
+        with pytest.raises(OSError, match="fsync failed"):
+            AtomicFileWriter.write_bytes(target_file, b"{}")
+
+        assert not target_file.exists()
+        assert list(temp_dir.glob(".result.json.*.tmp")) == []
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_round_trip_with_and_without_orjson(self, temp_dir, monkeypatch, use_orjson):
+        """Test write_json/read_json agree whether or not orjson is installed."""
+        if use_orjson and file_utils.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(file_utils, "orjson", None)
+        target_file = temp_dir / "config.json"
+        data = {"queues": [{"id": "ad-hoc", "path": "/tmp/ad-hoc"}], "version": "2.0", "n": 1}
+
+        AtomicFileWriter.write_json(target_file, data)
+
+        assert json.loads(target_file.read_text()) == data
+        assert AtomicFileWriter.read_json(target_file) == data
+
+        AtomicFileWriter.write_json(target_file, data, indent=None)
+
+        assert "\n" not in target_file.read_text()
+        assert AtomicFileWriter.read_json(target_file) == data
+
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_stdlib_fallback_matches_orjson_bytes(self, monkeypatch, indent):
+        """Test the stdlib encoder writes the same bytes orjson would."""
+        if file_utils.orjson is None:
+            pytest.skip("orjson not installed")
+        data = {"queues": [{"id": "ad-hoc", "description": "caf\u00e9"}], "settings": {}, "n": None}
+
+        expected = file_utils._dumps(data, indent)
+        monkeypatch.setattr(file_utils, "orjson", None)
+
+        assert file_utils._dumps(data, indent) == expected
+
     def test_read_json_with_default(self, temp_dir):
         """Test read_json returns default for non-existent file."""
         non_existent = temp_dir / "nonexistent.json"
@@ -197,7 +255,7 @@ class TestFileLockErrorHandling:
 
         assert lock.fd is None
 
-    def test_context_manager_acquire_fails(self, temp_dir):
+    def test_context_manager_acquire_fails(self, temp_dir, monkeypatch):
         """Test context manager raises when acquire fails."""
         lock_file = temp_dir / "test.lock"
 
@@ -207,10 +265,10 @@ class TestFileLockErrorHandling:
 
         lock2 = FileLock(lock_file)
 
-        with patch.object(lock2, 'acquire', return_value=False):
-            with pytest.raises(RuntimeError, match="Could not acquire lock"):
-                with lock2:
-                    pass
+        monkeypatch.setattr(lock2, "acquire", lambda *args, **kwargs: False)
+        with pytest.raises(RuntimeError, match="Could not acquire lock"):
+            with lock2:
+                pass
 
         lock1.release()
 
@@ -236,6 +294,41 @@ class TestFileLockErrorHandling:
         assert lock.is_locked() is False
 
 
+class TestMoveFile:
+    """Tests for move_file."""
+
+    def test_move_replaces_existing(self, temp_dir):
+        """Test move_file renames over an existing destination."""
+        src = temp_dir / "src.md"
+        dst = temp_dir / "dst.md"
+        src.write_text("new")
+        dst.write_text("old")
+
+        move_file(src, dst)
+
+        assert not src.exists()
+        assert dst.read_text() == "new"
+
+    def test_cross_device_falls_back_to_shutil(self, temp_dir):
+        """Test EXDEV from os.replace falls back to shutil.move."""
+        import errno
+
+        src = temp_dir / "src.md"
+        dst = temp_dir / "dst.md"
+        src.write_text("data")
+
+        with patch("task_monitor.file_utils.os.replace", side_effect=OSError(errno.EXDEV, "cross-device")):
+            with patch("task_monitor.file_utils.shutil.move") as mock_move:
+                move_file(src, dst)
+
+        mock_move.assert_called_once_with(str(src), str(dst))
+
+    def test_other_errors_propagate(self, temp_dir):
+        """Test non-EXDEV errors are raised without a fallback."""
+        with pytest.raises(FileNotFoundError):
+            move_file(temp_dir / "missing.md", temp_dir / "dst.md")
+
+
 class TestIsValidTaskId:
     """Tests for is_valid_task_id function."""
 
@@ -278,3 +371,7 @@ class TestIsValidTaskId:
     def test_only_prefix(self):
         """Test only 'task-' prefix."""
         assert is_valid_task_id("task-") is False
+
+    def test_non_ascii_digits(self):
+        """Test timestamps must use ASCII digits."""
+        assert is_valid_task_id("task-２０２６０２０７-123456-test") is False
@@ -1,5 +1,7 @@
 """Tests for TaskRunner (Directory-Based State Architecture)."""
 
+import contextlib
+import os
 import pytest
 import time
 import threading
@@ -58,6 +60,84 @@ class TestPickNextTask:
         task_names = [t.name for t in tasks]
         assert task_names == sorted(task_names)
 
+    def test_pick_next_task_from_queue_reuses_listing(self, multiple_task_files, project_root):
+        """Test picks reuse the cached listing until tasks leave pending/."""
+        runner = TaskRunner(str(project_root))
+        runner.watched_queues = {"test"}
+        queue = Queue(id="test", path=str(project_root / "tasks" / "ad-hoc"))
+
+        first = runner.pick_next_task_from_queue(queue)
+        with patch("task_monitor.task_runner.os.scandir") as mock_scandir:
+            # Unmoved head is returned again without rescanning
+            assert runner.pick_next_task_from_queue(queue) == first
+            first.unlink()
+            second = runner.pick_next_task_from_queue(queue)
+        mock_scandir.assert_not_called()
+        assert second is not None and second.name > first.name
+
+    def test_pick_skips_non_task_entries(self, project_root):
+        """Test directories and non-matching names in pending/ are ignored."""
+        pending = project_root / "tasks" / "ad-hoc" / "pending"
+        (pending / "task-20000101-000000-dir.md").mkdir()
+        (pending / "task-20000101-000001-notes.txt").write_text("x")
+        (pending / "readme.md").write_text("x")
+        task = pending / "task-20000101-000002-real.md"
+        task.write_text("# Real")
+
+        runner = TaskRunner(str(project_root))
+        queue = Queue(id="test", path=str(project_root / "tasks" / "ad-hoc"))
+
+        assert runner.pick_next_task([queue]) == task
+        assert runner.pick_next_task_from_queue(queue) == task
+
+    def test_invalidate_queue_rescans(self, multiple_task_files, project_root):
+        """Test invalidate_queue makes the next pick see newly added tasks."""
+        runner = TaskRunner(str(project_root))
+        runner.watched_queues = {"test"}
+        queue = Queue(id="test", path=str(project_root / "tasks" / "ad-hoc"))
+        runner.pick_next_task_from_queue(queue)
+
+        earliest = project_root / "tasks" / "ad-hoc" / "pending" / "task-20000101-000000-early.md"
+        earliest.write_text("# Early")
+        # Until the watchdog event arrives the cached listing is served
+        assert runner.pick_next_task_from_queue(queue) == multiple_task_files[0]
+        runner.invalidate_queue("test")
+
+        assert runner.pick_next_task_from_queue(queue) == earliest
+
+    def test_unwatched_queue_rescans_every_pick(self, multiple_task_files, project_root):
+        """Test queues without watchdog invalidation are never served from a cache."""
+        runner = TaskRunner(str(project_root))
+        queue = Queue(id="test", path=str(project_root / "tasks" / "ad-hoc"))
+        assert runner.pick_next_task_from_queue(queue) == multiple_task_files[0]
+        assert "test" not in runner._pending_cache
+
+        # A new task that sorts first is picked next, with no invalidation
+        earliest = project_root / "tasks" / "ad-hoc" / "pending" / "task-20000101-000000-early.md"
+        earliest.write_text("# Early")
+
+        assert runner.pick_next_task_from_queue(queue) == earliest
+
+    def test_invalidation_during_scan_is_not_overwritten(self, multiple_task_files, project_root):
+        """Test a scan that raced invalidate_queue() is not stored as the cached listing."""
+        runner = TaskRunner(str(project_root))
+        runner.watched_queues = {"test"}
+        queue = Queue(id="test", path=str(project_root / "tasks" / "ad-hoc"))
+        earliest = project_root / "tasks" / "ad-hoc" / "pending" / "task-20000101-000000-early.md"
+        real_scandir = os.scandir
+
+        def scandir_then_add_task(path):
+            # The watchdog reports a new task after the directory was listed
+            entries = list(real_scandir(path))
+            earliest.write_text("# Early")
+            runner.invalidate_queue("test")
+            return contextlib.nullcontext(iter(entries))
+
+        with patch("task_monitor.task_runner.os.scandir", side_effect=scandir_then_add_task):
+            assert runner.pick_next_task_from_queue(queue) == multiple_task_files[0]
+
+        assert runner.pick_next_task_from_queue(queue) == earliest
+
     def test_pick_next_task_from_multiple_sources(self, project_root):
         """Test picking tasks from multiple sources."""
         # Create two queue directories